@@ -0,0 +1,273 @@
+################################################################################
+#                                                                              #
+# assets.py : Module qui regroupe les fichiers du jeu (textures et polices)    #
+#     dans une archive unique, projetée en mémoire au lancement pour que la    #
+#     SDL les lise directement sans copie ni ouverture de fichiers séparés     #
+#                                                                              #
+# L'archive est générée au premier lancement dans le dossier de cache de       #
+# l'utilisateur, et regénérée dès qu'un des fichiers du jeu est modifié. Pour  #
+# la regénérer à la main : python assets.py                                    #
+#                                                                              #
+################################################################################
+
+import hashlib, mmap, os, struct
+from ctypes import addressof, c_char, sizeof
+
+# ============================================================================ #
+# CONSTANTES                                                                   #
+# ============================================================================ #
+
+# Dossier qui contient les fichiers du jeu (celui de ce module), pour ne pas
+# dépendre du dossier depuis lequel le jeu est lancé
+ASSETS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Dossier de cache de l'utilisateur, où sont écrits les fichiers générés par
+# le jeu (le dossier du jeu peut être en lecture seule)
+USER_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or
+                              os.path.join(os.path.expanduser("~"), ".cache"),
+                              "othello")
+
+# Nom de l'archive dans USER_CACHE_DIR
+PACK_FILE = "assets.pak"
+
+# Signature placée au début de l'archive
+PACK_MAGIC = b"OTHPAK02"
+
+# Fichiers placés dans l'archive
+ASSET_FILES = ["board.png", "light.png", "dark.png", "tile.png",
+               "Tahoma.ttf", "Alegreya_SC-M.ttf"]
+
+# Format de l'archive (entiers en little-endian) :
+#     signature PACK_MAGIC, uint32 : nombre de fichiers, puis pour chaque
+#     fichier : uint16 : longueur du nom, nom en UTF-8, uint32 : position des
+#     données depuis le début de l'archive, uint32 : taille des données,
+#     uint64 : date de modification du fichier source (en nanosecondes) ;
+#     enfin les données des fichiers les unes à la suite des autres
+# La taille et la date permettent de détecter qu'un fichier a été modifié
+# depuis la génération de l'archive
+PACK_HEADER = struct.Struct("<8sI")
+PACK_NAME   = struct.Struct("<H")
+PACK_ENTRY  = struct.Struct("<IIQ")
+
+# ============================================================================ #
+# GLOBALES                                                                     #
+# ============================================================================ #
+
+# Projection en mémoire de l'archive (None si elle n'est pas ouverte)
+Pack = None
+
+# Index des fichiers de l'archive, les noms sont en minuscules pour retrouver
+# les fichiers quelle que soit la casse utilisée (comme sous Windows). Seuls
+# les fichiers identiques à leur fichier source y figurent.
+# Format: {str : nom du fichier : (int : position, int : taille)}
+Index = {}
+
+# Contenu des fichiers lus en mémoire une seule fois par RWFromAsset() quand
+# ils ne sont pas dans l'archive et doivent être partagés (ex: une police
+# ouverte en plusieurs tailles). Ils restent en mémoire jusqu'à Close().
+# Format: {str : nom du fichier en minuscules : tableau ctypes c_char}
+Buffers = {}
+
+# ============================================================================ #
+# FONCTIONS                                                                    #
+# ============================================================================ #
+
+def SourcePath(name):
+# Fonction qui renvoie le chemin du fichier source d'un fichier du jeu. Comme
+# dans l'archive, la casse du nom est ignorée : il est cherché dans ASSET_FILES
+# pour obtenir le nom réel du fichier (les systèmes de fichiers Linux
+# distinguent les majuscules)
+# PARAMÈTRES:
+#     name : nom du fichier
+
+    for assetName in ASSET_FILES:
+        if assetName.lower() == name.lower():
+            return os.path.join(ASSETS_DIR, assetName)
+    return os.path.join(ASSETS_DIR, name)
+
+# ============================================================================ #
+
+def Build():
+# Fonction qui (re)génère l'archive à partir des fichiers de ASSET_FILES
+# AUCUN PARAMÈTRE
+
+    contents = []
+    stamps = []
+    for name in ASSET_FILES:
+        with open(os.path.join(ASSETS_DIR, name), "rb") as file:
+            contents.append(file.read())
+            stamps.append(os.fstat(file.fileno()).st_mtime_ns)
+
+    # Taille de l'en-tête et de l'index, pour connaître la position des données
+    offset = PACK_HEADER.size
+    for name in ASSET_FILES:
+        offset += PACK_NAME.size + len(name.encode()) + PACK_ENTRY.size
+
+    header = [PACK_HEADER.pack(PACK_MAGIC, len(ASSET_FILES))]
+    for name, data, stamp in zip(ASSET_FILES, contents, stamps):
+        header.append(PACK_NAME.pack(len(name.encode())))
+        header.append(name.encode())
+        header.append(PACK_ENTRY.pack(offset, len(data), stamp))
+        offset += len(data)
+
+    # Écriture dans un fichier temporaire renommé ensuite, pour qu'un autre
+    # lancement du jeu ne lise jamais une archive à moitié écrite
+    os.makedirs(USER_CACHE_DIR, exist_ok=True)
+    path = os.path.join(USER_CACHE_DIR, PACK_FILE)
+    with open(path + ".tmp", "wb") as file:
+        file.write(b"".join(header))
+        for data in contents:
+            file.write(data)
+    os.replace(path + ".tmp", path)
+
+# ============================================================================ #
+
+def Load():
+# Fonction qui projette l'archive en mémoire et lit son index, en n'y gardant
+# que les fichiers identiques à leur fichier source. Renvoie True si
+# l'archive est valide et à jour, False sinon (archive absente, invalide ou
+# contenant un fichier modifié depuis sa génération).
+# AUCUN PARAMÈTRE
+
+    global Pack
+
+    try:
+        with open(os.path.join(USER_CACHE_DIR, PACK_FILE), "rb") as file:
+            # ACCESS_COPY : projection privée, les pages sont partagées avec
+            # le cache du système tant qu'on ne les modifie pas (ce qu'on ne
+            # fait jamais), mais ctypes peut obtenir leur adresse (from_buffer)
+            Pack = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError):
+        # ValueError : fichier vide, qui ne peut pas être projeté
+        return False
+
+    try:
+        magic, count = PACK_HEADER.unpack_from(Pack, 0)
+        if magic != PACK_MAGIC:
+            Close()
+            return False
+        entries = {}
+        position = PACK_HEADER.size
+        for i in range(count):
+            length = PACK_NAME.unpack_from(Pack, position)[0]
+            position += PACK_NAME.size
+            name = Pack[position:position + length].decode()
+            position += length
+            entries[name] = PACK_ENTRY.unpack_from(Pack, position)
+            position += PACK_ENTRY.size
+    except (struct.error, UnicodeDecodeError):
+        # Archive tronquée ou abîmée
+        Close()
+        return False
+
+    upToDate = True
+    for name, (offset, size, stamp) in entries.items():
+        try:
+            info = os.stat(SourcePath(name))
+            fresh = info.st_size == size and info.st_mtime_ns == stamp
+        except OSError:
+            # Sans fichier source, le contenu de l'archive est le seul connu
+            fresh = True
+        if fresh and offset + size <= len(Pack):
+            Index[name.lower()] = (offset, size)
+        else:
+            upToDate = False
+    return upToDate and len(entries) == len(ASSET_FILES)
+
+# ============================================================================ #
+
+def Open():
+# Fonction qui ouvre l'archive, en la (re)générant si elle n'existe pas encore
+# ou n'est plus à jour. Si elle ne peut pas être générée (dossier de cache en
+# lecture seule, etc.), les fichiers qui n'y sont pas ou plus à jour seront lus
+# séparément. Renvoie False si l'archive n'a pas pu être ouverte.
+# AUCUN PARAMÈTRE
+
+    if Load():
+        return True
+    try:
+        Build()
+    except OSError:
+        return Pack != None
+    Close()
+    Load()
+    return Pack != None
+
+# ============================================================================ #
+
+def RWFromAsset(name, shared=False):
+# Fonction qui renvoie un SDL_RWops pour lire un fichier du jeu : directement
+# dans la mémoire de l'archive si elle est ouverte et contient le fichier,
+# sinon depuis le fichier dans ASSETS_DIR. Renvoie NULL si le fichier ne peut
+# pas être lu (voir SDL_GetError()).
+# PARAMÈTRES:
+#     name : nom du fichier
+#     shared : booléen indiquant que le fichier sera ouvert plusieurs fois
+#         (ex: police en plusieurs tailles). S'il n'est pas dans l'archive, il
+#         est alors lu une seule fois en mémoire et partagé entre les SDL_RWops
+
+    # Import local : la génération de l'archive (python assets.py) ne doit pas
+    # dépendre de la présence des librairies de la SDL
+    from sdl2 import SDL_RWFromConstMem, SDL_RWFromFile, SDL_SetError
+
+    entry = Index.get(name.lower())
+    if Pack != None and entry != None:
+        # L'objet c_char ne sert qu'à obtenir l'adresse des données, il est
+        # libéré aussitôt pour que la projection puisse être fermée par Close()
+        address = addressof(c_char.from_buffer(Pack, entry[0]))
+        return SDL_RWFromConstMem(address, entry[1])
+    if shared:
+        buffer = Buffers.get(name.lower())
+        if buffer == None:
+            try:
+                with open(SourcePath(name), "rb") as file:
+                    data = file.read()
+            except OSError as error:
+                SDL_SetError(str(error).encode())
+                return None
+            buffer = (c_char * len(data)).from_buffer_copy(data)
+            Buffers[name.lower()] = buffer
+        return SDL_RWFromConstMem(addressof(buffer), sizeof(buffer))
+    return SDL_RWFromFile(SourcePath(name).encode(), b"rb")
+
+# ============================================================================ #
+
+def HashAsset(name):
+# Fonction qui renvoie l'empreinte SHA-1 (en hexadécimal) du contenu d'un
+# fichier du jeu, lu dans l'archive si elle est ouverte. Renvoie None si le
+# fichier ne peut pas être lu.
+# PARAMÈTRES:
+#     name : nom du fichier
+
+    entry = Index.get(name.lower())
+    if Pack != None and entry != None:
+        # La vue est libérée à la sortie du bloc pour ne pas bloquer Close()
+        with memoryview(Pack)[entry[0]:entry[0] + entry[1]] as data:
+            return hashlib.sha1(data).hexdigest()
+    try:
+        with open(SourcePath(name), "rb") as file:
+            return hashlib.sha1(file.read()).hexdigest()
+    except OSError:
+        return None
+
+# ============================================================================ #
+
+def Close():
+# Fonction qui ferme la projection de l'archive. Elle ne doit être appelée
+# qu'une fois que plus rien ne lit les données (polices fermées, etc.)
+# AUCUN PARAMÈTRE
+
+    global Pack
+
+    if Pack != None:
+        Pack.close()
+        Pack = None
+    Index.clear()
+    Buffers.clear()
+
+# ============================================================================ #
+# PROGRAMME PRINCIPAL                                                          #
+# ============================================================================ #
+
+if __name__ == "__main__":
+    Build()
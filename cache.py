@@ -0,0 +1,170 @@
+################################################################################
+#                                                                              #
+# cache.py : Module qui garde sur le disque les textures déjà décodées, dans   #
+#     le format de pixels de la fenêtre, pour que les lancements suivants      #
+#     n'aient ni PNG à décompresser ni conversion de format à faire            #
+#                                                                              #
+################################################################################
+
+import mmap, os, struct
+from ctypes import addressof, c_char, string_at
+
+from sdl2 import *
+from sdl2.sdlimage import *
+
+import assets
+
+# ============================================================================ #
+# CONSTANTES                                                                   #
+# ============================================================================ #
+
+# Dossier du cache (créé au besoin), dans le dossier de cache de l'utilisateur
+# comme l'archive des fichiers du jeu
+CACHE_DIR = os.path.join(assets.USER_CACHE_DIR, "textures")
+
+# Signature placée au début de chaque fichier du cache
+CACHE_MAGIC = b"OTHRAW01"
+
+# En-tête d'un fichier du cache (entiers en little-endian) :
+#     signature CACHE_MAGIC, uint32 : largeur, hauteur, pitch (octets par
+#     ligne), profondeur (bits par pixel), masques rouge, vert, bleu et alpha
+# L'en-tête est complété jusqu'à CACHE_HEADER_SIZE octets pour que les pixels
+# qui suivent soient bien alignés en mémoire
+CACHE_HEADER = struct.Struct("<8s8I")
+CACHE_HEADER_SIZE = 64
+
+# ============================================================================ #
+# GLOBALES                                                                     #
+# ============================================================================ #
+
+# Projections en mémoire des fichiers du cache dont les pixels sont utilisés
+# par des surfaces. Elles doivent rester ouvertes tant que ces surfaces existent
+Mappings = []
+
+# ============================================================================ #
+# FONCTIONS                                                                    #
+# ============================================================================ #
+
+def CachePath(name, pixelFormat):
+# Fonction qui renvoie le chemin du fichier du cache d'une texture : il dépend
+# du contenu du fichier source et du format de pixels, ainsi toute
+# modification de l'un ou de l'autre invalide le cache. Renvoie None si le
+# fichier source ne peut pas être lu.
+# PARAMÈTRES:
+#     name : nom du fichier de la texture
+#     pixelFormat : format de pixels SDL_PIXELFORMAT_* de la texture décodée
+
+    digest = assets.HashAsset(name)
+    if digest == None:
+        return None
+    return os.path.join(CACHE_DIR, "{}-{:08x}.raw".format(digest, pixelFormat))
+
+# ============================================================================ #
+
+def Read(path):
+# Fonction qui crée une surface dont les pixels sont directement ceux d'un
+# fichier du cache projeté en mémoire. Renvoie None si le fichier n'existe pas
+# ou est invalide.
+# PARAMÈTRES:
+#     path : chemin du fichier du cache
+
+    try:
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError):
+        return None
+
+    # Fichier tronqué, trop court pour contenir l'en-tête
+    if len(mapping) < CACHE_HEADER_SIZE:
+        mapping.close()
+        return None
+    header = CACHE_HEADER.unpack_from(mapping, 0)
+    w, h, pitch, depth = header[1:5]
+    if header[0] != CACHE_MAGIC \
+    or len(mapping) != CACHE_HEADER_SIZE + h*pitch:
+        mapping.close()
+        return None
+
+    # Comme dans assets.RWFromAsset(), l'objet c_char ne sert qu'à obtenir
+    # l'adresse des pixels
+    pixels = addressof(c_char.from_buffer(mapping, CACHE_HEADER_SIZE))
+    surface = SDL_CreateRGBSurfaceFrom(pixels, w, h, depth, pitch,
+                                       *header[5:9])
+    if not surface:
+        mapping.close()
+        return None
+    Mappings.append(mapping)
+    return surface
+
+# ============================================================================ #
+
+def Write(path, surface):
+# Fonction qui enregistre les pixels d'une surface dans un fichier du cache.
+# Les erreurs d'écriture (dossier en lecture seule, etc.) sont ignorées : le
+# cache n'est qu'une optimisation.
+# PARAMÈTRES:
+#     path : chemin du fichier du cache
+#     surface : surface à enregistrer
+
+    s = surface.contents
+    f = s.format.contents
+    header = CACHE_HEADER.pack(CACHE_MAGIC, s.w, s.h, s.pitch, f.BitsPerPixel,
+                               f.Rmask, f.Gmask, f.Bmask, f.Amask)
+
+    SDL_LockSurface(surface)
+    pixels = string_at(s.pixels, s.h * s.pitch)
+    SDL_UnlockSurface(surface)
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # On écrit dans un fichier temporaire puis on le renomme pour qu'un
+        # autre lancement ne lise jamais un fichier incomplet
+        with open(path + ".tmp", "wb") as file:
+            file.write(header.ljust(CACHE_HEADER_SIZE, b"\0"))
+            file.write(pixels)
+        os.replace(path + ".tmp", path)
+    except OSError:
+        pass
+
+# ============================================================================ #
+
+def LoadTexture(name, pixelFormat):
+# Fonction qui renvoie la surface d'une texture dans le format de pixels
+# demandé : depuis le cache s'il existe, sinon en décodant le fichier puis en
+# enregistrant le résultat dans le cache. Renvoie None en cas d'erreur (voir
+# IMG_GetError() ou SDL_GetError()).
+# PARAMÈTRES:
+#     name : nom du fichier de la texture
+#     pixelFormat : format de pixels SDL_PIXELFORMAT_* voulu
+
+    path = CachePath(name, pixelFormat)
+    if path != None:
+        surface = Read(path)
+        if surface != None:
+            return surface
+
+    # Pas de cache : on décode le fichier et on le convertit dans le format
+    source = assets.RWFromAsset(name)
+    if not source:
+        return None
+    decoded = IMG_Load_RW(source, True)
+    if not decoded:
+        return None
+    surface = SDL_ConvertSurfaceFormat(decoded, pixelFormat, 0)
+    SDL_FreeSurface(decoded)
+    if not surface:
+        return None
+    if path != None:
+        Write(path, surface)
+    return surface
+
+# ============================================================================ #
+
+def Close():
+# Fonction qui ferme les projections des fichiers du cache. Elle ne doit être
+# appelée qu'une fois les surfaces qui les utilisent libérées.
+# AUCUN PARAMÈTRE
+
+    for mapping in Mappings:
+        mapping.close()
+    Mappings.clear()
@@ -11,10 +11,14 @@
 # chaînes de caractères et des chaînes d'octets représentant ces chaînes en
 # UTF-8 pour les utiliser avec la SDL2
 
+from ctypes import addressof, c_int
+
 from sdl2 import *
 from sdl2.sdlimage import *
 from sdl2.sdlttf import *
 
+import assets, cache, startup
+
 # ============================================================================ #
 # CONSTANTES                                                                   #
 # ============================================================================ #
@@ -24,6 +28,24 @@ from sdl2.sdlttf import *
 UI_MODE_INGAME   = 0  # Mode jeu de l'interface
 UI_MODE_SCORES   = 1  # Affiche le score de chaque joueur
 
+# Valeurs passées à Init() pour choisir le moteur de rendu de la fenêtre
+RENDERER_SOFTWARE    = 0  # Rendu logiciel sur la surface de la fenêtre
+RENDERER_ACCELERATED = 1  # Rendu matériel avec SDL_Renderer et des textures
+
+# Pilotes vidéo sans affichage réel (serveurs d'intégration continue, etc.)
+# pour lesquels le rendu matériel n'a pas de sens
+HEADLESS_VIDEO_DRIVERS = [b"dummy", b"offscreen"]
+
+# Zones des boutons de l'interface des scores (bornes incluses), utilisées pour
+# leur affichage et pour la détection de la souris (voir HitTest())
+# Format: [(int : x de début, x de fin, y de début, y de fin), ...]
+SCORES_BUTTONS = [(70,  295, 370, 408),  # Bouton "Nouvelle partie"
+                  (328, 521, 370, 408)]  # Bouton "Quitter le jeu"
+
+# Indices des boutons dans SCORES_BUTTONS, renvoyés par HitTest()
+BUTTON_NEWGAME = 0
+BUTTON_QUIT    = 1
+
 # Couleurs d'arrière-plan des boutons des différentes interfaces
 BUTTON_BG_COLOR = [SDL_Color(0x00, 0x40, 0xD0),
                    SDL_Color(0x08, 0x50, 0xE0),
@@ -36,6 +58,21 @@ BUTTON_BG_COLOR = [SDL_Color(0x00, 0x40, 0xD0),
 # Objet qui correspond à la fenêtre du jeu
 Window = None
 
+# Moteur de rendu matériel de la fenêtre (None si le rendu est logiciel)
+Renderer = None
+
+# Dictionnaire des textures envoyées au moteur de rendu matériel, indexées par
+# l'adresse de la surface dont elles sont la copie
+# Format: {int : adresse de la SDL_Surface : SDL_Texture}
+TextureCache = {}
+
+# Format de pixels (SDL_PIXELFORMAT_*) de la fenêtre, utilisé pour les surfaces
+# opaques, et de celui des textures (format de la fenêtre avec couche alpha)
+# pour les surfaces transparentes. Avec ces formats, l'affichage d'une surface
+# dans la fenêtre n'a aucune conversion de pixels à faire.
+WindowFormat = None
+TextureFormat = None
+
 # Tableau référençant les structures qui correspondent aux textures du jeu
 # Format: [SDL_Surface : texture, str : nom du fichier]
 Textures = [[None, "board.png"], # Cadre du plateau
@@ -43,15 +80,46 @@ Textures = [[None, "board.png"], # Cadre du plateau
             [None, "dark.png" ], # Pion noir
             [None, "tile.png" ]] # Fond d'une case du plateau
 
+# Arrière-plan du plateau (cadre et fond des 64 cases) composé une seule fois
+# dans Init() puisqu'il ne change jamais au cours du jeu
+Background = None
+
+# Tableau ctypes des 64 SDL_Rect qui décrivent la position de chaque case dans
+# la fenêtre, calculé une fois dans Init() et réutilisé à chaque affichage
+# La case (x, y) se trouve à l'indice y*8 + x
+CellRects = None
+
+# Positions des éléments de l'interface des scores, réutilisées à chaque
+# affichage (même principe que CellRects)
+# Format: [fond, "Partie terminée!", score, pion blanc, pion noir, "a gagné",
+#          pion du gagnant, "Égalité", bouton "Nouvelle partie",
+#          bouton "Quitter le jeu"]
+ScoresRects = None
+
 # Masque transparent qui est appliqué par dessus le plateau pour l'assombrir et
 # afficher l'interface graphique
 Mask = None
 
+# Arrière-plan des interfaces autres que celle du jeu (plateau et pions
+# assombris par Mask), composé par DrawBackdrop() et réutilisé tant que le
+# plateau ne change pas
+# Format: [SDL_Surface : arrière-plan, tuple : plateau qu'il représente]
+Backdrop = [None, None]
+
 # Tableau référençant les polices d'écriture utilisés par l'interface
 # Format: [TTF_Font : police, str : nom du fichier, int : taille de la police]
-Fonts = [[None, "tahoma.ttf", 32], # Police pour la plupart des textes
-         [None, "tahoma.ttf", 40], # Police pour des éléments plus grands
-         [None, "Alegreya_SC-M.ttf", 32]] # Police pour les boutons
+Fonts = [[None, "Tahoma.ttf", 32], # Police pour la plupart des textes
+         [None, "Tahoma.ttf", 40], # Police pour des éléments plus grands
+         [None, "Alegreya_SC-M.ttf", 32], # Police pour les boutons
+         [None, "Tahoma.ttf", 14]] # Police de l'incrustation des statistiques
+
+# Booléen indiquant si les polices de Fonts ont été chargées (voir LoadFonts())
+FontsLoaded = False
+
+# Polices ouvertes par OpenFont(), pour ne jamais ouvrir deux fois la même
+# police à la même taille
+# Format: {(str : nom du fichier en minuscules, int : taille) : TTF_Font}
+OpenFonts = {}
 
 # Tableau qui contiendra les caches de surfaces et les informations de validité
 # pour chaque type d'interface utilisateur pour éviter de les regénérer à chaque
@@ -59,98 +127,637 @@ Fonts = [[None, "tahoma.ttf", 32], # Police pour la plupart des textes
 UiCaches = [[None, None], # INGAME -> pions avec transparence
             [None, None]] # SCORES -> textes et boutons de l'interface
 
+# Atlas de glyphes (voir CreateGlyphAtlas()) des textes qui changent souvent,
+# générés avec les polices par LoadFonts()
+# Format: [atlas des scores, atlas de l'incrustation des statistiques]
+Atlases = [None, None]
+
+# Nombre maximal d'étiquettes gardées dans ValueLabels
+VALUE_LABELS_MAX = 512
+
+# Caractères des atlas de glyphes
+SCORE_CHARS   = "0123456789 -"
+OVERLAY_CHARS = "".join([chr(c) for c in range(32, 127)])
+
+# SDL_Rect de travail utilisé par DrawText() et DrawUI() pour placer chaque
+# glyphe ou étiquette
+TextRect = None
+
+# Étiquettes déjà générées des évaluations des coups affichées sur les indices
+# (voir GetValueLabel()) : afficher l'analyse ne demande ainsi aucun rendu de
+# texte à chaque image
+# Format: {str : texte de l'étiquette : SDL_Surface}
+ValueLabels = {}
+
+# Position de l'incrustation dans la fenêtre (coin supérieur gauche)
+OverlayRect = None
+
+# Grilles de détection de chaque interface (voir BuildHitGrid()), calculées une
+# fois dans Init()
+# Format: [grille de UI_MODE_INGAME, grille de UI_MODE_SCORES]
+HitGrids = [None, None]
+
 # ============================================================================ #
 # FONCTIONS                                                                    #
 # ============================================================================ #
 
-def MouseIn(mouse_x, mouse_y, start_x, end_x, start_y, end_y):
-# Fonction qui vérifie si la souris survole une zone specifiée
+def BuildHitGrid(areas, size):
+# Fonction qui renvoie la grille de détection d'une interface, qui associe
+# chaque pixel de la fenêtre à l'élément qui s'y trouve. Les bords des zones
+# découpent la fenêtre en bandes verticales et horizontales : la grille garde,
+# pour chaque colonne et chaque ligne de pixels, l'indice de sa bande, et pour
+# chaque croisement de bandes, l'élément qui le recouvre (ou None). Trouver
+# l'élément sous la souris ne demande alors que trois accès (voir HitTest()).
+# Format: [list : bande de chaque colonne, list : bande de chaque ligne,
+#          list : [list : élément de chaque croisement de bandes]]
 # PARAMÈTRES:
-#     mouse_x : coordonnée x de la souris dans la fenêtre
-#     mouse_y : coordonnée y de la souris dans la fenêtre
-#     start_x : coordonnée x du début de la zone
-#     end_x : coordonnée x de fin de la zone
-#     start_y : coordonnée y du début de la zone
-#     end_y : coordonnée y de fin de la zone
-    return True if start_x <= mouse_x <= end_x and start_y <= mouse_y <= end_y \
-        else False
-
-def Init():
-# Fonction qui initialise les librairies externes, charge les textures et la
-# police de texte de l'interface, puis ouvre la fenêtre du jeu. Cette fonction
-# lève des exceptions si une erreur survient pour suspendre le programme.
-# AUCUN PARAMÈTRE
+#     areas : liste des zones (x de début, x de fin, y de début, y de fin,
+#         bornes incluses) et de leur élément: [(élément, x0, x1, y0, y1), ...]
+#     size : taille (largeur et hauteur) de la fenêtre en pixels
+
+    bands = []
+    for axis in (0, 1):
+        edges = sorted(set([0, size] + [area[1 + 2*axis] for area in areas]
+                           + [area[2 + 2*axis] + 1 for area in areas]))
+        band = [0] * size
+        for i in range(len(edges) - 1):
+            for pixel in range(edges[i], min(edges[i+1], size)):
+                band[pixel] = i
+        bands.append(band)
+
+    columns, rows = bands
+    table = [[None] * (columns[-1] + 1) for i in range(rows[-1] + 1)]
+    for element, x0, x1, y0, y1 in areas:
+        for row in range(rows[y0], rows[y1] + 1):
+            for column in range(columns[x0], columns[x1] + 1):
+                table[row][column] = element
+    return [columns, rows, table]
+
+# ============================================================================ #
+
+def HitTest(ui, x, y):
+# Fonction qui renvoie l'élément d'une interface qui se trouve à une position de
+# la fenêtre, ou None s'il n'y en a pas : les coordonnées (x, y) de la case du
+# plateau pour UI_MODE_INGAME, l'indice du bouton (BUTTON_NEWGAME ou
+# BUTTON_QUIT) pour UI_MODE_SCORES
+# PARAMÈTRES:
+#     ui : valeur qui indique quelle type d'interface est affichée
+#     x : coordonnée x dans la fenêtre (-1 si à l'extérieur)
+#     y : coordonnée y dans la fenêtre (-1 si à l'extérieur)
+
+    columns, rows, table = HitGrids[ui]
+    if 0 <= x < len(columns) and 0 <= y < len(rows):
+        return table[rows[y]][columns[x]]
+    return None
+
+# ============================================================================ #
+
+def AlphaFormat(pixelFormat):
+# Fonction qui renvoie le format de pixels 32 bits équivalent à celui donné mais
+# avec une couche alpha (ex: SDL_PIXELFORMAT_RGB888 -> ARGB8888). Un format qui
+# a déjà une couche alpha est renvoyé tel quel, et SDL_PIXELFORMAT_ARGB8888 est
+# utilisé pour les formats qui n'ont pas d'équivalent (16 bits, palette, ...)
+# PARAMÈTRES:
+#     pixelFormat : format de pixels SDL_PIXELFORMAT_*
+
+    bpp = c_int()
+    r, g, b, a = Uint32(), Uint32(), Uint32(), Uint32()
+    if not SDL_PixelFormatEnumToMasks(pixelFormat, bpp, r, g, b, a) \
+    or bpp.value not in (24, 32):
+        return SDL_PIXELFORMAT_ARGB8888
+    if a.value != 0:
+        return pixelFormat
+    # Les 8 bits inutilisés par les couleurs deviennent la couche alpha
+    alphaFormat = SDL_MasksToPixelFormatEnum(32, r, g, b,
+                                    0xFFFFFFFF & ~(r.value | g.value | b.value))
+    if alphaFormat == SDL_PIXELFORMAT_UNKNOWN:
+        return SDL_PIXELFORMAT_ARGB8888
+    return alphaFormat
+
+# ============================================================================ #
+
+def CreateSurface(w, h, alpha):
+# Fonction qui crée une surface vide dans le format de la fenêtre (ou celui des
+# textures si elle doit être transparente)
+# PARAMÈTRES:
+#     w : largeur de la surface
+#     h : hauteur de la surface
+#     alpha : booléen indiquant si la surface a une couche alpha
+
+    bpp = c_int()
+    r, g, b, a = Uint32(), Uint32(), Uint32(), Uint32()
+    SDL_PixelFormatEnumToMasks(TextureFormat if alpha else WindowFormat,
+                               bpp, r, g, b, a)
+    return SDL_CreateRGBSurface(0, w, h, bpp.value, r, g, b, a)
+
+# ============================================================================ #
+
+def RenderText(font, text, color, background):
+# Fonction qui génère la surface d'un texte sur un fond uni, convertie dans le
+# format de la fenêtre (TTF_RenderUTF8_Shaded génère une surface à palette qui
+# devrait sinon être convertie à chaque affichage)
+# PARAMÈTRES:
+#     font : police du texte
+#     text : texte à afficher
+#     color : SDL_Color du texte
+#     background : SDL_Color du fond
+
+    shaded = TTF_RenderUTF8_Shaded(font, text.encode(), color, background)
+    surface = SDL_ConvertSurfaceFormat(shaded, WindowFormat, 0)
+    SDL_FreeSurface(shaded)
+    return surface
+
+# ============================================================================ #
+
+def CreateGlyphAtlas(font, chars, color, background):
+# Fonction qui génère l'atlas de glyphes d'une police pour une couleur donnée :
+# chaque caractère est rendu une seule fois par FreeType et placé sur une même
+# ligne d'une surface. Un texte composé de ces caractères s'affiche ensuite
+# avec DrawText() par une copie par caractère, sans appel à FreeType.
+# Format: [SDL_Surface : atlas, dict : {str : caractère : SDL_Rect : zone du
+#          glyphe dans l'atlas}]
+# PARAMÈTRES:
+#     font : police des glyphes
+#     chars : chaîne des caractères à placer dans l'atlas
+#     color : SDL_Color des glyphes
+#     background : SDL_Color du fond
+
+    # Rendu de chaque glyphe (la largeur de la surface générée est l'avance
+    # du caractère, c'est à dire la place qu'il occupe dans un texte)
+    glyphs = [RenderText(font, char, color, background) for char in chars]
+    width = sum([glyph.contents.w for glyph in glyphs])
+    height = max([glyph.contents.h for glyph in glyphs])
+
+    atlas = [CreateSurface(width, height, False), {}]
+    x = 0
+    for char, glyph in zip(chars, glyphs):
+        atlas[1][char] = SDL_Rect(x, 0, glyph.contents.w, glyph.contents.h)
+        SDL_BlitSurface(glyph, None, atlas[0], SDL_Rect(x, 0))
+        x += glyph.contents.w
+        SDL_FreeSurface(glyph)
+    return atlas
+
+# ============================================================================ #
+
+def DrawText(atlas, text, x, y):
+# Fonction qui affiche un texte dans la fenêtre à partir d'un atlas de glyphes.
+# Les caractères absents de l'atlas sont ignorés.
+# PARAMÈTRES:
+#     atlas : atlas de glyphes généré par CreateGlyphAtlas()
+#     text : texte à afficher
+#     x : coordonnée x du début du texte dans la fenêtre
+#     y : coordonnée y du haut du texte dans la fenêtre
+
+    for char in text:
+        glyph = atlas[1].get(char)
+        if glyph != None:
+            TextRect.x = x
+            TextRect.y = y
+            Blit(atlas[0], TextRect, glyph)
+            x += glyph.w
+
+# ============================================================================ #
+
+def GetValueLabel(text):
+# Fonction qui renvoie la surface de l'étiquette d'une évaluation, générée lors
+# de la première demande de ce texte puis gardée dans ValueLabels
+# PARAMÈTRES:
+#     text : texte de l'étiquette
+
+    label = ValueLabels.get(text)
+    if label == None:
+        # Le nombre de valeurs différentes est limité en pratique, on vide
+        # tout de même le cache s'il devient trop grand
+        if len(ValueLabels) >= VALUE_LABELS_MAX:
+            for surface in ValueLabels.values():
+                FreeSurface(surface)
+            ValueLabels.clear()
+        LoadFonts()
+        label = RenderText(Fonts[3][0], text, SDL_Color(0xFF,0xFF,0xFF),
+                           SDL_Color(0x00,0x00,0x00))
+        ValueLabels[text] = label
+    return label
+
+# ============================================================================ #
+
+def GetTexture(surface):
+# Fonction qui renvoie la texture du moteur de rendu matériel correspondant à
+# une surface, en la créant lors du premier appel. La texture reprend la
+# transparence et le mode de mélange de la surface.
+# PARAMÈTRES:
+#     surface : surface dont on veut la texture
+
+    key = addressof(surface.contents)
+    texture = TextureCache.get(key)
+    if texture == None:
+        texture = SDL_CreateTextureFromSurface(Renderer, surface)
+        if not texture:
+            raise Exception("Erreur de création d'une texture : " +
+                            SDL_GetError().decode())
+        TextureCache[key] = texture
+    return texture
+
+# ============================================================================ #
+
+def Blit(surface, rect, srcrect=None):
+# Fonction qui affiche une surface (ou une partie d'une surface) dans la fenêtre
+# avec le moteur de rendu utilisé (logiciel ou matériel)
+# PARAMÈTRES:
+#     surface : surface à afficher
+#     rect : SDL_Rect de la position dans la fenêtre (None pour l'origine)
+#     srcrect : SDL_Rect de la partie de la surface à afficher (None pour
+#         toute la surface)
+
+    if Renderer == None:
+        SDL_BlitSurface(surface, srcrect, SDL_GetWindowSurface(Window), rect)
+    else:
+        # SDL_RenderCopy a besoin de la taille de la destination. Les SDL_Rect
+        # passés sont réutilisés d'un affichage à l'autre (voir CellRects) et
+        # servent de zone de travail, comme avec SDL_BlitSurface qui y écrit
+        # la zone réellement copiée. Sans position, la surface recouvre toute
+        # la fenêtre.
+        if rect != None and srcrect != None:
+            rect.w = srcrect.w
+            rect.h = srcrect.h
+        elif rect != None:
+            rect.w = surface.contents.w
+            rect.h = surface.contents.h
+        SDL_RenderCopy(Renderer, GetTexture(surface), srcrect, rect)
+
+# ============================================================================ #
+
+def BlitBatch(surface, rects, indices=None):
+# Fonction qui affiche une même surface à plusieurs positions de la fenêtre en
+# un seul appel, sans créer de SDL_Rect pour chaque position
+# PARAMÈTRES:
+#     surface : surface à afficher
+#     rects : tableau ctypes de SDL_Rect des positions dans la fenêtre
+#     indices : positions du tableau à utiliser (None pour toutes)
+
+    if Renderer == None:
+        blit_surfaces(surface, SDL_GetWindowSurface(Window), rects, indices)
+    else:
+        texture = GetTexture(surface)
+        if indices == None:
+            indices = range(len(rects))
+        for index in indices:
+            # Le tableau sert de zone de travail (comme avec SDL_BlitSurface,
+            # qui y écrit la zone réellement copiée) : on y place la taille de
+            # la surface attendue par SDL_RenderCopy
+            rect = rects[index]
+            rect.w = surface.contents.w
+            rect.h = surface.contents.h
+            SDL_RenderCopy(Renderer, texture, None, rect)
+
+# ============================================================================ #
+
+def FreeSurface(surface):
+# Fonction qui libère une surface ainsi que sa texture si elle en a une
+# PARAMÈTRES:
+#     surface : surface à libérer (peut être nulle)
+
+    if surface:
+        texture = TextureCache.pop(addressof(surface.contents), None)
+        if texture != None:
+            SDL_DestroyTexture(texture)
+    SDL_FreeSurface(surface)
+
+# ============================================================================ #
+
+def Init(renderer=RENDERER_SOFTWARE):
+# Fonction qui initialise les librairies externes, ouvre la fenêtre du jeu et
+# charge les textures (les polices sont chargées plus tard par LoadFonts()).
+# Cette fonction lève des exceptions si une erreur survient pour suspendre le
+# programme.
+# PARAMÈTRES:
+#     renderer : moteur de rendu souhaité (RENDERER_SOFTWARE par défaut). Le
+#         rendu matériel se replie sur le rendu logiciel s'il est indisponible
 
     # On identifie les variables suivantes comme des globales puisque nous les
     # modifions dans cette fonction
-    global Window, Textures, Mask, Fonts
+    global Window, Renderer, WindowFormat, TextureFormat, Textures, \
+           Background, CellRects, ScoresRects, OverlayRect, TextRect, Mask
 
     # Initialisation de la librairie SDL2 et de ses extensions
+    # (chaque étape est mesurée par le module startup)
+    start = startup.Start()
     if SDL_InitSubSystem(SDL_INIT_VIDEO) != 0:
         raise Exception("Erreur d'initialisation de SDL2 (Vidéo) : " +
                         SDL_GetError().decode())
+    startup.Record("display.Init : SDL (vidéo)", start)
+    start = startup.Start()
     if TTF_Init() != 0:
         raise Exception("Erreur d'initialisation de SDL_TTF :" +
                         TTF_GetError().decode())
+    startup.Record("display.Init : SDL_TTF", start)
+    start = startup.Start()
     if IMG_Init(IMG_INIT_PNG) != IMG_INIT_PNG:
         raise Exception("Erreur d'initialisation de SDL_Image : " +
                         IMG_GetError().decode())
-
-    # Chargement des textures
+    startup.Record("display.Init : SDL_Image", start)
+
+    # Ouverture de l'archive des fichiers du jeu (s'il n'y en a pas, les
+    # fichiers seront lus séparément)
+    start = startup.Start()
+    assets.Open()
+    startup.Record("display.Init : archive", start)
+
+    # Ouverture de la fenêtre du jeu (taille 592x592px, centrée sur l'écran).
+    # Elle est ouverte avant le chargement des textures pour connaître son
+    # format de pixels. Avec le rendu matériel, la fenêtre peut être agrandie
+    # et profite des écrans haute densité, l'image étant mise à l'échelle par
+    # le GPU
+    if renderer == RENDERER_ACCELERATED \
+    and SDL_GetCurrentVideoDriver() in HEADLESS_VIDEO_DRIVERS:
+        renderer = RENDERER_SOFTWARE
+    flags = 0
+    if renderer == RENDERER_ACCELERATED:
+        flags = SDL_WINDOW_RESIZABLE | SDL_WINDOW_ALLOW_HIGHDPI
+    start = startup.Start()
+    Window = SDL_CreateWindow(b"Jeu de l'Othello", SDL_WINDOWPOS_CENTERED,
+                              SDL_WINDOWPOS_CENTERED, 592, 592, flags)
+    if not Window:
+        raise Exception("Erreur d'ouverture de la fenêtre : " +
+                        SDL_GetError().decode())
+    startup.Record("display.Init : fenêtre", start)
+
+    # Création du moteur de rendu matériel si demandé. En cas d'échec, on passe
+    # au rendu logiciel (Renderer = None) : la fenêtre est alors recréée sans
+    # redimensionnement ni haute densité, que seul le GPU sait mettre à
+    # l'échelle
+    if renderer == RENDERER_ACCELERATED:
+        start = startup.Start()
+        Renderer = SDL_CreateRenderer(Window, -1, SDL_RENDERER_ACCELERATED)
+        if Renderer:
+            # Taille logique fixe : les coordonnées (dessin et souris) restent
+            # celles d'une fenêtre 592x592 quelle que soit sa taille réelle
+            SDL_RenderSetLogicalSize(Renderer, 592, 592)
+        else:
+            Renderer = None
+            SDL_DestroyWindow(Window)
+            Window = SDL_CreateWindow(b"Jeu de l'Othello",
+                                      SDL_WINDOWPOS_CENTERED,
+                                      SDL_WINDOWPOS_CENTERED, 592, 592, 0)
+            if not Window:
+                raise Exception("Erreur d'ouverture de la fenêtre : " +
+                                SDL_GetError().decode())
+        startup.Record("display.Init : moteur de rendu matériel", start)
+
+    # Format dans lequel les textures sont gardées : celui de la fenêtre, avec
+    # une couche alpha s'il n'en a pas (les pions ont des bords transparents)
+    WindowFormat = SDL_GetWindowPixelFormat(Window)
+    TextureFormat = AlphaFormat(WindowFormat)
+
+    # Chargement des textures (depuis le cache des textures décodées s'il
+    # existe)
     for texture in Textures:
-        # On ouvre puis charge le fichier de texture
-        rwops = SDL_RWFromFile(texture[1].encode(), b"r")
-        texture[0] = IMG_Load_RW(rwops, True)
+        start = startup.Start()
+        texture[0] = cache.LoadTexture(texture[1], TextureFormat)
         # On vérifie que la texture a bien été chargée
         if not texture[0]:
             raise Exception("Erreur du chargement de la texture " + texture[1] +
                             " : " + IMG_GetError().decode())
+        startup.Record("display.Init : texture " + texture[1], start)
+
+    # Le pion blanc sert d'icône à la fenêtre
+    SDL_SetWindowIcon(Window, Textures[1][0])
+
+    # On calcule les positions des cases et des éléments de l'interface qui
+    # seront réutilisées à chaque affichage
+    CellRects = (SDL_Rect * 64)(*[SDL_Rect(32 + x*66, 32 + y*66)
+                                  for y in range(8) for x in range(8)])
+    ScoresRects = [SDL_Rect(0,   146), SDL_Rect(156, 160), SDL_Rect(246, 242),
+                   SDL_Rect(182, 230), SDL_Rect(346, 230), SDL_Rect(270, 302),
+                   SDL_Rect(206, 290), SDL_Rect(248, 302)] \
+                + [SDL_Rect(button[0], button[2]) for button in SCORES_BUTTONS]
+    OverlayRect = SDL_Rect(4, 4)
+    TextRect = SDL_Rect()
+
+    # On calcule les grilles de détection de la souris : les 64 cases du
+    # plateau pour le jeu, les boutons pour l'interface des scores
+    HitGrids[UI_MODE_INGAME] = BuildHitGrid(
+                                   [((x, y), 32 + x*66, 32 + x*66 + 65,
+                                             32 + y*66, 32 + y*66 + 65)
+                                    for y in range(8) for x in range(8)], 592)
+    HitGrids[UI_MODE_SCORES] = BuildHitGrid(
+                                   [(i,) + SCORES_BUTTONS[i]
+                                    for i in range(len(SCORES_BUTTONS))], 592)
+
+    # On compose l'arrière-plan du plateau : le cadre puis le fond de chaque
+    # case. DrawBoard() n'aura plus qu'à l'afficher en une seule opération
+    start = startup.Start()
+    Background = CreateSurface(592, 592, False)
+    SDL_BlitSurface(Textures[0][0], None, Background, None)
+    blit_surfaces(Textures[3][0], Background, CellRects)
+    # L'arrière-plan recouvre toute la fenêtre : on le copie sans mélange alpha
+    SDL_SetSurfaceBlendMode(Background, SDL_BLENDMODE_NONE)
 
     # On génère le masque transparent appliqué entre le plateau et l'interface
-    Mask = SDL_CreateRGBSurface(0, 592, 592, 32,
-                                0xFF, 0xFF<<8, 0xFF<<16, 0xFF<<24)
-    SDL_FillRect(Mask, None, 0xA0000000) # (Noir - Opacité 60%)
+    Mask = CreateSurface(592, 592, True)
+    # (Noir - Opacité 60%)
+    SDL_FillRect(Mask, None, SDL_MapRGBA(Mask.contents.format,
+                                         0x00, 0x00, 0x00, 0xA0))
+    startup.Record("display.Init : arrière-plan et masque", start)
+
+    # Avec le rendu matériel, les textures constantes sont envoyées au GPU une
+    # seule fois
+    if Renderer != None:
+        start = startup.Start()
+        for surface in [Background] + [t[0] for t in Textures]:
+            GetTexture(surface)
+        startup.Record("display.Init : envoi des textures au GPU", start)
+
+# ============================================================================ #
+
+def DrawBoard(board):
+# Fonction qui affiche le plateau avec les pions dans la fenêtre
+# PARAMÈTRES:
+#     board : tableau 2D qui correspond aux cases du plateau
+
+    # Avec le rendu matériel, on efface d'abord les bandes noires qui entourent
+    # le plateau quand la fenêtre n'a pas ses proportions d'origine
+    if Renderer != None:
+        SDL_RenderClear(Renderer)
+
+    # Affichage de l'arrière-plan pré-composé (bord et fond des cases)
+    Blit(Background, None)
+
+    # Affichage des pions du plateau : on regroupe les cases de chaque couleur
+    # pour afficher tous les pions d'une même couleur en un seul appel
+    for color in (1, 2):
+        cells = [y*8 + x for y in range(8) for x in range(8)
+                 if board[y][x] == color]
+        if len(cells) > 0:
+            BlitBatch(Textures[color][0], CellRects, cells)
+    return
+
+# ============================================================================ #
+
+def DrawBackdrop(board):
+# Fonction qui affiche le plateau assombri par le masque transparent, derrière
+# les interfaces autres que celle du jeu. Le plateau, les pions et le masque
+# sont composés dans Backdrop une seule fois, puis seulement recomposés si le
+# plateau a changé : survoler les boutons ne coûte alors qu'une copie opaque
+# au lieu d'un mélange alpha de toute la fenêtre.
+# PARAMÈTRES:
+#     board : tableau 2D qui correspond aux cases du plateau
+
+    key = tuple([tuple(row) for row in board])
+    if Backdrop[1] != key:
+        # La surface est recréée plutôt que redessinée pour que l'ancienne
+        # texture du moteur de rendu matériel soit libérée avec elle
+        FreeSurface(Backdrop[0])
+        Backdrop[0] = CreateSurface(592, 592, False)
+        SDL_BlitSurface(Background, None, Backdrop[0], None)
+        for color in (1, 2):
+            cells = [y*8 + x for y in range(8) for x in range(8)
+                     if board[y][x] == color]
+            if len(cells) > 0:
+                blit_surfaces(Textures[color][0], Backdrop[0], CellRects,
+                              cells)
+        SDL_BlitSurface(Mask, None, Backdrop[0], None)
+        SDL_SetSurfaceBlendMode(Backdrop[0], SDL_BLENDMODE_NONE)
+        Backdrop[1] = key
+
+    if Renderer != None:
+        SDL_RenderClear(Renderer)
+    Blit(Backdrop[0], None)
+
+# ============================================================================ #
+
+def OpenFont(name, size):
+# Fonction qui renvoie une police à une taille donnée. Le fichier de la police
+# n'est lu qu'une fois quel que soit le nombre de tailles ouvertes : toutes
+# les tailles partagent le même contenu en mémoire (voir assets.RWFromAsset()).
+# Renvoie None en cas d'erreur (voir TTF_GetError()).
+# PARAMÈTRES:
+#     name : nom du fichier de la police
+#     size : taille de la police en points
+
+    key = (name.lower(), size)
+    font = OpenFonts.get(key)
+    if font == None:
+        source = assets.RWFromAsset(name, True)
+        if not source:
+            return None
+        font = TTF_OpenFontRW(source, True, size)
+        if not font:
+            return None
+        OpenFonts[key] = font
+    return font
+
+# ============================================================================ #
+
+def LoadFonts():
+# Fonction qui charge les polices d'écriture de l'interface graphique si ce
+# n'est pas déjà fait. Elles ne servent qu'à l'interface des scores (et à
+# l'incrustation des statistiques), on ne les charge donc pas dans Init() pour
+# que la première image ne dépende pas de FreeType. Cette fonction lève une
+# exception si une police ne peut pas être chargée.
+# AUCUN PARAMÈTRE
 
-    # Chargement des polices d'écriture pour l'interface graphique
+    global FontsLoaded
+
+    if FontsLoaded:
+        return
     for font in Fonts:
         # On ouvre et on charge la police
-        rwops = SDL_RWFromFile(font[1].encode(), b"r")
-        font[0] = TTF_OpenFontRW(rwops, True, font[2])
+        start = startup.Start()
+        font[0] = OpenFont(font[1], font[2])
         # On vérifié que la police a bien été chargée
         if not font[0]:
             raise Exception("Erreur du chargement de la police " + font[1] +
                             " : " + TTF_GetError().decode())
+        startup.Record("display.LoadFonts : police {} {}".format(font[1],
+                                                                 font[2]),
+                       start)
+
+    # Atlas de glyphes des textes dynamiques : le score (noir sur blanc) et
+    # l'incrustation des statistiques (blanc sur noir)
+    Atlases[0] = CreateGlyphAtlas(Fonts[0][0], SCORE_CHARS,
+                                  SDL_Color(0x00,0x00,0x00),
+                                  SDL_Color(0xFF,0xFF,0xFF))
+    Atlases[1] = CreateGlyphAtlas(Fonts[3][0], OVERLAY_CHARS,
+                                  SDL_Color(0xFF,0xFF,0xFF),
+                                  SDL_Color(0x00,0x00,0x00))
+    FontsLoaded = True
 
-    # Ouverture de la fenêtre du jeu (taille 592x592px, centrée sur l'écran)
-    # avec le pion blanc comme icône
-    Window = SDL_CreateWindow(b"Jeu de l'Othello", SDL_WINDOWPOS_CENTERED,
-                              SDL_WINDOWPOS_CENTERED, 592, 592, 0)
-    SDL_SetWindowIcon(Window, Textures[1][0])
+# ============================================================================ #
+
+def BuildScoresCache():
+# Fonction qui génère les surfaces constantes de l'interface des scores (fond
+# et textes) et les place dans son cache, si ce n'est pas déjà fait
+# AUCUN PARAMÈTRE
+
+    uiCache = UiCaches[UI_MODE_SCORES]
+    if uiCache[0] != None:
+        return
+    LoadFonts()
+
+    # On initialise le cache de surfaces avec 10 emplacements
+    # (initialisés par None). Le score n'y figure pas : il est affiché avec
+    # l'atlas de glyphes Atlases[0]
+    # Format: [fond, "Partie terminée!", "a gagné", "Égalité",
+    #          bouton "Nouvelle partie" x3, bouton "Quitter le jeu" x3]
+    uiCache[0] = [None] * 10
+
+    # Fond blanc de l'interface
+    uiCache[0][0] = CreateSurface(592, 300, False)
+    SDL_FillRect(uiCache[0][0], None,
+                 SDL_MapRGB(uiCache[0][0].contents.format,
+                            0xFF, 0xFF, 0xFF)) # Blanc
+
+    # On génère les différentes surfaces des textes de l'interface
+    uiCache[0][1] = RenderText(Fonts[1][0], "Partie terminée!",
+                               SDL_Color(0x00,0x00,0x00),
+                               SDL_Color(0xFF,0xFF,0xFF))
+    uiCache[0][2] = RenderText(Fonts[0][0], "a gagné",
+                               SDL_Color(0x00,0x00,0x00),
+                               SDL_Color(0xFF,0xFF,0xFF))
+    uiCache[0][3] = RenderText(Fonts[0][0], "Égalité",
+                               SDL_Color(0x00,0x00,0x00),
+                               SDL_Color(0xFF,0xFF,0xFF))
+
+    # On génère les boutons dans chacun de leurs états (voir BUTTON_BG_COLOR :
+    # normal, survolé, sélectionné) pour n'avoir qu'à choisir la bonne surface
+    # lors de l'affichage
+    for state in range(3):
+        uiCache[0][4 + state] = RenderText(Fonts[2][0], " Nouvelle partie ",
+                                           SDL_Color(0x00,0x00,0x00),
+                                           BUTTON_BG_COLOR[state])
+        uiCache[0][7 + state] = RenderText(Fonts[2][0], " Quitter le jeu ",
+                                           SDL_Color(0x00,0x00,0x00),
+                                           BUTTON_BG_COLOR[state])
 
 # ============================================================================ #
 
-def DrawBoard(board):
-# Fonction qui affiche le plateau avec les pions dans la fenêtre
+def Prewarm():
+# Fonction appelée pendant le temps libre de la boucle d'évènements après la
+# première image : elle charge les polices et prépare l'interface des scores
+# pour qu'elles soient prêtes quand la partie se termine
+# AUCUN PARAMÈTRE
+
+    BuildScoresCache()
+
+# ============================================================================ #
+
+def HoveredElement(ui, mouse_x, mouse_y, data):
+# Fonction qui renvoie l'élément d'une interface survolé par la souris, parmi
+# ceux dont l'affichage dépend de la souris (None si aucun) : les coordonnées
+# de l'indice survolé pour UI_MODE_INGAME, l'indice du bouton survolé pour
+# UI_MODE_SCORES. Tant que cet élément ne change pas, DrawUI() affiche
+# exactement la même image.
 # PARAMÈTRES:
-#     board : tableau 2D qui correspond aux cases du plateau
+#     ui : valeur qui indique quelle type d'interface est affichée
+#     mouse_x : coordonnée x de la souris dans la fenêtre (-1 si à l'extérieur)
+#     mouse_y : coordonnée y de la souris dans la fenêtre (-1 si à l'extérieur)
+#     data: complément de données de l'interface (voir DrawUI())
 
-    windowSurface = SDL_GetWindowSurface(Window)
-
-    # Affichage du bord du plateau
-    SDL_BlitSurface(Textures[0][0], None, windowSurface, None)
-
-    # Affichage des cases du plateau
-    for y in range(8):
-        for x in range(8):
-            # Structure qui décrit la position de la case dans la fenêtre
-            rect = SDL_Rect(32 + x*66, 32 + y*66)
-            # Affichage du fond de la case
-            SDL_BlitSurface(Textures[3][0], None, windowSurface, rect)
-            # Si la case n'est pas vide, on dessine le pion de la bonne couleur
-            color = board[y][x]
-            if color != 0:
-                SDL_BlitSurface(Textures[color][0], None, windowSurface, rect)
-    return
+    element = HitTest(ui, mouse_x, mouse_y)
+    # En jeu, seules les cases des indices changent d'apparence
+    if ui == UI_MODE_INGAME and (data == None or element not in data[0]):
+        return None
+    return element
 
 # ============================================================================ #
 
@@ -166,12 +773,13 @@ def DrawUI(ui, mouse_x, mouse_y, mouse_dw, data):
 #     mouse_dw : booléen indiquant si le bouton de la souris est pressé
 #     data: complément de données utilisées par certaines interfaces (ex: score)
 
-    windowSurface = SDL_GetWindowSurface(Window)
     uiCache = UiCaches[ui]
 
     # Interface 0 : UI_MODE_INGAME:
     # Mode qui affiche les indices de jeu pour le joueur actuel
-    # data : [list : coordonnées des indices, int : couleur des pions du joueur]
+    # data : [list : coordonnées des indices, int : couleur des pions du joueur,
+    #         dict : évaluation de chaque indice (None si elle n'est pas
+    #         affichée) : {tuple : coordonnées (x, y) : str : valeur}]
     if ui == UI_MODE_INGAME:
         # Si cela n'a pas déjà été fait, on génère les surfaces des pions
         # transparents pour les indices et on les place dans le cache
@@ -179,8 +787,7 @@ def DrawUI(ui, mouse_x, mouse_y, mouse_dw, data):
             uiCache[0] = []
 
             for i in range(6):
-                uiCache[0].append(SDL_CreateRGBSurface(0, 66, 66, 32,
-                                             0xFF, 0xFF<<8, 0xFF<<16, 0xFF<<24))
+                uiCache[0].append(CreateSurface(66, 66, True))
                 # Pour i = {0;1;2} pion blanc, pour i = {3;4;5} pion noir
                 SDL_BlitSurface(Textures[1+int(i/3)][0], None, uiCache[0][i],
                                 None)
@@ -198,143 +805,100 @@ def DrawUI(ui, mouse_x, mouse_y, mouse_dw, data):
 
         # Affiche les indices de jeu d'un joueur s'ils ont été renseignés
         if data != None:
+            # Case survolée par la souris
+            cell = HitTest(ui, mouse_x, mouse_y)
+
             for hint in data[0]:
                 # Structure qui décrit la position de la case dans la fenêtre
-                rect = SDL_Rect(32 + hint[0]*66, 32 + hint[1]*66)
+                rect = CellRects[hint[1]*8 + hint[0]]
 
                 # Détecte si la case est survolée par la souris
-                hovered = MouseIn(mouse_x, mouse_y,
-                                  rect.x, rect.x+65, rect.y, rect.y + 65)
+                hovered = hint == cell
 
                 # Si la case est survolée et que le bouton gauche de la souris
                 # est pressé, la case est selectionnée
                 selected = hovered and mouse_dw
 
                 # Affiche la surface correspondante à la situation
-                SDL_BlitSurface(uiCache[0][3*(data[1]-1) + hovered + selected],
-                                None, windowSurface, rect)
+                Blit(uiCache[0][3*(data[1]-1) + hovered + selected], rect)
 
-    # Avant de dessiner d'autres types d'interfaces, on applique le masque
-    # transparent qui assombri l'arrière-plan de ces interfaces par dessus le
-    # plateau (déjà affiché par un appel précédent à DrawBoard())
-    else:
-        SDL_BlitSurface(Mask, None, windowSurface, None)
+                # Affiche l'évaluation du coup dans le coin de la case si elle
+                # est connue
+                if data[2] != None and hint in data[2]:
+                    TextRect.x = rect.x + 2
+                    TextRect.y = rect.y + 2
+                    Blit(GetValueLabel(data[2][hint]), TextRect)
+
+    # Les autres types d'interfaces sont dessinés par dessus le plateau assombri
+    # (déjà affiché par un appel précédent à DrawBackdrop())
 
     # Interface 1 : UI_MODE_SCORES
     # Affiche les scores des joueurs, qui a gagné et deux boutons "Nouvelle
     # partie" et "Quitter le jeu"
     # data: [int : score joueur blanc, int : score joueur noir]
     if ui == UI_MODE_SCORES:
-        # Si cela n'a pas déjà été fait, on génère les surfaces constantes de ce
-        # mode et on les place dans le cache
-        if uiCache[0] == None:
-            # On initialise le cache de surfaces avec 7 emplacements
-            # (initialisés par None)
-            uiCache[0] = [None] * 7
-
-            # Fond blanc de l'interface
-            uiCache[0][0] = SDL_CreateRGBSurface(0, 592, 300, 32,
-                                              0xFF, 0xFF<<8, 0xFF<<16, 0xFF<<24)
-            SDL_FillRect(uiCache[0][0], None, 0xFFFFFFFF) # Blanc
-
-            # On génère les différentes surfaces des textes de l'interface
-            uiCache[0][1] = TTF_RenderUTF8_Shaded(Fonts[1][0],
-                                                  "Partie terminée!".encode(),
-                                                  SDL_Color(0x00,0x00,0x00),
-                                                  SDL_Color(0xFF,0xFF,0xFF))
-            uiCache[0][3] = TTF_RenderUTF8_Shaded(Fonts[0][0],
-                                                  "a gagné".encode(),
-                                                  SDL_Color(0x00,0x00,0x00),
-                                                  SDL_Color(0xFF,0xFF,0xFF))
-            uiCache[0][4] = TTF_RenderUTF8_Shaded(Fonts[0][0],
-                                                  "Égalité".encode(),
-                                                  SDL_Color(0x00,0x00,0x00),
-                                                  SDL_Color(0xFF,0xFF,0xFF))
-
-            # Initialisation des valeurs de vérification du cache:
-            # Aucune des surfaces dynamique n'a été générée, donc on initialise
-            # à -1 pour qu'elles soient générées plus tard
-            uiCache[1] = [-1, -1, -1, -1]
-
-        # Si la surface du score en cache ne correspond plus au score actuel
-        # (score de la partie précédente), on la régénère
-        if uiCache[1][2] != data[0] \
-        or uiCache[1][3] != data[1]:
-            # On libère la surface précédente
-            SDL_FreeSurface(uiCache[0][2])
-            # On formatte le texte affiché avec le score
-            score_str = "{:>2d} - {:<2d}".format(data[0], data[1])
-            # On génère la surface et on la place dans le cache
-            uiCache[0][2] = TTF_RenderUTF8_Shaded(Fonts[0][0],
-                                                  score_str.encode(),
-                                                  SDL_Color(0x00,0x00,0x00),
-                                                  SDL_Color(0xFF,0xFF,0xFF))
-            # On met à jour les informations de validité du cache
-            uiCache[1][2] = data[0]
-            uiCache[1][3] = data[1]
+        # Si cela n'a pas déjà été fait (voir Prewarm()), on génère les surfaces
+        # constantes de ce mode et on les place dans le cache
+        BuildScoresCache()
 
         # On vérifie si la souris survole ou sélectionne un des boutons de
         # l'interface
-        newgame_button_hovered = MouseIn(mouse_x, mouse_y, 70, 295, 370, 408)
+        button = HitTest(ui, mouse_x, mouse_y)
+        newgame_button_hovered = button == BUTTON_NEWGAME
         newgame_button_selected = newgame_button_hovered and mouse_dw
-        quitgame_button_hovered = MouseIn(mouse_x, mouse_y, 328, 521, 370, 408)
+        quitgame_button_hovered = button == BUTTON_QUIT
         quitgame_button_selected = quitgame_button_hovered and mouse_dw
 
-        # On régère la surface du bouton "Nouvelle partie" si son statut n'est
-        # plus le même que celui de la surface dans le cache
-        if newgame_button_hovered + newgame_button_selected != uiCache[1][0]:
-            SDL_FreeSurface(uiCache[0][5])
-            uiCache[0][5] = TTF_RenderUTF8_Shaded(Fonts[2][0],
-                                                  " Nouvelle partie ".encode(),
-                                                  SDL_Color(0x00,0x00,0x00),
-                                       BUTTON_BG_COLOR[newgame_button_hovered +
-                                                       newgame_button_selected])
-            uiCache[1][0] = newgame_button_hovered + newgame_button_selected
-
-        # De même pour le bouton "Quitter le jeu"
-        if quitgame_button_hovered + quitgame_button_selected != uiCache[1][1]:
-            SDL_FreeSurface(uiCache[0][6])
-            uiCache[0][6] = TTF_RenderUTF8_Shaded(Fonts[2][0],
-                                                  " Quitter le jeu ".encode(),
-                                                  SDL_Color(0x00,0x00,0x00),
-                                      BUTTON_BG_COLOR[quitgame_button_hovered +
-                                                      quitgame_button_selected])
-            uiCache[1][1] = quitgame_button_hovered + quitgame_button_selected
-
         # On affiche enfin les différentes surfaces dans la fenêtre
         # Fond blanc
-        SDL_BlitSurface(uiCache[0][0], None, windowSurface, SDL_Rect(0,   146))
+        Blit(uiCache[0][0], ScoresRects[0])
         # "Partie terminée"
-        SDL_BlitSurface(uiCache[0][1], None, windowSurface, SDL_Rect(156, 160))
-        # Score
-        SDL_BlitSurface(uiCache[0][2], None, windowSurface, SDL_Rect(246, 242))
-        SDL_BlitSurface(Textures[1][0], None, windowSurface, SDL_Rect(182,230))
-        SDL_BlitSurface(Textures[2][0], None, windowSurface, SDL_Rect(346,230))
+        Blit(uiCache[0][1], ScoresRects[1])
+        # Score (composé à partir de l'atlas de glyphes)
+        DrawText(Atlases[0], "{:>2d} - {:<2d}".format(data[0], data[1]),
+                 ScoresRects[2].x, ScoresRects[2].y)
+        Blit(Textures[1][0], ScoresRects[3])
+        Blit(Textures[2][0], ScoresRects[4])
 
         # "X a gagné" ou "Égalité"
         if data[0] != data[1]:
             winner = 1 if data[0] > data[1] else 2
-            SDL_BlitSurface(uiCache[0][3], None, windowSurface,
-                            SDL_Rect(270, 302))
-            SDL_BlitSurface(Textures[winner][0], None, windowSurface,
-                            SDL_Rect(206,290))
+            Blit(uiCache[0][2], ScoresRects[5])
+            Blit(Textures[winner][0], ScoresRects[6])
         else:
-            SDL_BlitSurface(uiCache[0][4], None, windowSurface,
-                            SDL_Rect(248,302))
+            Blit(uiCache[0][3], ScoresRects[7])
 
-        # Bouton "Nouvelle partie"
-        SDL_BlitSurface(uiCache[0][5], None, windowSurface, SDL_Rect(70,  370))
+        # Bouton "Nouvelle partie" dans l'état correspondant à la souris
+        Blit(uiCache[0][4 + newgame_button_hovered + newgame_button_selected],
+             ScoresRects[8])
         # Bouton "Quitter le jeu"
-        SDL_BlitSurface(uiCache[0][6], None, windowSurface, SDL_Rect(328, 370))
+        Blit(uiCache[0][7 + quitgame_button_hovered + quitgame_button_selected],
+             ScoresRects[9])
     return
 
 # ============================================================================ #
 
+def DrawOverlay(text):
+# Fonction qui incruste un texte (les statistiques d'affichage) en haut à gauche
+# de la fenêtre, à partir de l'atlas de glyphes Atlases[1]
+# PARAMÈTRES:
+#     text : texte à afficher
+
+    if text == "":
+        return
+    LoadFonts()
+    DrawText(Atlases[1], text, OverlayRect.x, OverlayRect.y)
+
+# ============================================================================ #
+
 def UpdateWindow():
 # Fonction qui raffraîchit l'écran (les modifications effectuées sur la fenêtre
-# avec SDL_BlitSurface() n'apparaissent pas spontanément)
+# avec Blit() n'apparaissent pas spontanément)
 
-    SDL_UpdateWindowSurface(Window)
+    if Renderer == None:
+        SDL_UpdateWindowSurface(Window)
+    else:
+        SDL_RenderPresent(Renderer)
 
 # ============================================================================ #
 
@@ -347,15 +911,31 @@ def Quit():
     for uiCache in UiCaches:
         if uiCache[0] != None:
             for surface in uiCache[0]:
-                SDL_FreeSurface(surface)
+                FreeSurface(surface)
+    for atlas in Atlases:
+        if atlas != None:
+            FreeSurface(atlas[0])
+    for label in ValueLabels.values():
+        FreeSurface(label)
+    ValueLabels.clear()
     for texture in Textures:
-        SDL_FreeSurface(texture[0])
-    SDL_FreeSurface(Mask)
-
-    for font in Fonts:
-        TTF_CloseFont(font[0])
-
-    # On ferme la fenêtre du jeu
+        FreeSurface(texture[0])
+    FreeSurface(Background)
+    FreeSurface(Mask)
+    FreeSurface(Backdrop[0])
+
+    for font in OpenFonts.values():
+        TTF_CloseFont(font)
+    OpenFonts.clear()
+
+    # Plus rien ne lit l'archive ou le cache une fois les polices fermées et
+    # les textures libérées
+    cache.Close()
+    assets.Close()
+
+    # On ferme la fenêtre du jeu et son moteur de rendu
+    if Renderer != None:
+        SDL_DestroyRenderer(Renderer)
     SDL_DestroyWindow(Window)
 
     # On libère les différentes librairies externes
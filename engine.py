@@ -0,0 +1,725 @@
+################################################################################
+#                                                                              #
+# engine.py : Module du joueur ordinateur. La recherche du coup à jouer tourne #
+#     dans un processus séparé (voir Worker()) qui communique avec le jeu par  #
+#     deux files de messages : la fenêtre reste ainsi réactive pendant que     #
+#     l'ordinateur réfléchit sur un autre cœur du processeur                   #
+#                                                                              #
+# Ce module n'importe pas sdl2 : le processus de recherche n'en a pas besoin   #
+#                                                                              #
+################################################################################
+
+import multiprocessing, queue, time
+
+import game, stability
+
+# ============================================================================ #
+# CONSTANTES                                                                   #
+# ============================================================================ #
+
+# Les plateaux sont représentés dans le processus de recherche par deux entiers
+# de 64 bits (un par joueur), la case (x, y) correspondant au bit y*8 + x
+FULL = 0xFFFFFFFFFFFFFFFF
+
+# Décalages qui déplacent les pions d'une case dans chacune des 8 directions,
+# avec le masque qui efface les pions passés d'un bord du plateau à l'autre
+# Format: [(int : décalage, int : masque), ...]
+DIRECTIONS = [( 1, 0xFEFEFEFEFEFEFEFE), (-1, 0x7F7F7F7F7F7F7F7F),
+              ( 8, FULL),               (-8, FULL),
+              ( 9, 0xFEFEFEFEFEFEFEFE), (-9, 0x7F7F7F7F7F7F7F7F),
+              ( 7, 0x7F7F7F7F7F7F7F7F), (-7, 0xFEFEFEFEFEFEFEFE)]
+
+# Valeur de chaque case pour l'évaluation d'une position : les coins sont très
+# recherchés, les cases qui les donnent à l'adversaire sont à éviter
+WEIGHTS = [100, -20,  10,   5,   5,  10, -20, 100,
+           -20, -50,  -2,  -2,  -2,  -2, -50, -20,
+            10,  -2,  -1,  -1,  -1,  -1,  -2,  10,
+             5,  -2,  -1,  -1,  -1,  -1,  -2,   5,
+             5,  -2,  -1,  -1,  -1,  -1,  -2,   5,
+            10,  -2,  -1,  -1,  -1,  -1,  -2,  10,
+           -20, -50,  -2,  -2,  -2,  -2, -50, -20,
+           100, -20,  10,   5,   5,  10, -20, 100]
+
+# Poids de la mobilité (nombre de coups possibles) dans l'évaluation
+MOBILITY_WEIGHT = 5
+
+# Poids des pions stables (voir le module stability) dans l'évaluation
+STABILITY_WEIGHT = 10
+
+# Valeur d'une position de fin de partie par pion d'écart : toujours supérieure
+# à celle de n'importe quelle évaluation d'une partie en cours
+WIN_SCORE = 10000
+
+# Borne supérieure des valeurs de la recherche
+INFINITY = 1000000
+
+# Profondeur maximale de la recherche (en demi-coups)
+MAX_DEPTH = 60
+
+# Temps de réflexion par défaut du joueur ordinateur (en secondes)
+THINK_TIME = 1.0
+
+# Nombre de positions examinées entre deux lectures de la file des requêtes
+POLL_NODES = 1024
+
+# Nombre maximal de positions gardées dans la table de transpositions
+TABLE_SIZE = 1 << 18
+
+# Types de valeurs gardées dans la table de transpositions : la recherche
+# alpha-bêta ne donne la valeur exacte d'une position que si elle se trouve
+# entre alpha et bêta, sinon seulement une borne
+BOUND_EXACT = 0  # Valeur exacte
+BOUND_LOWER = 1  # Borne inférieure (la position vaut au moins cette valeur)
+BOUND_UPPER = 2  # Borne supérieure (la position vaut au plus cette valeur)
+
+# Profondeur à partir de laquelle un coup déjà trouvé pendant la réflexion
+# anticipée (voir PonderSearch()) est joué sans chercher davantage
+PONDER_HIT_DEPTH = 5
+
+# Types des messages envoyés au processus de recherche
+# Format: [REQUEST_SEARCH, int : numéro, int : pions du joueur, int : pions
+#          de l'adversaire, float : temps de réflexion]
+#         [REQUEST_PONDER, int : numéro, int : pions du joueur humain,
+#          int : pions de l'ordinateur]
+#         [REQUEST_MOVE_NOW], [REQUEST_CANCEL], [REQUEST_QUIT]
+REQUEST_SEARCH   = 0  # Chercher le coup à jouer dans une position
+REQUEST_MOVE_NOW = 1  # Jouer tout de suite le meilleur coup trouvé
+REQUEST_CANCEL   = 2  # Abandonner la recherche en cours sans répondre
+REQUEST_QUIT     = 3  # Arrêter le processus de recherche
+REQUEST_PONDER   = 4  # Réfléchir pendant que le joueur humain choisit son coup
+
+# Types des messages renvoyés par le processus de recherche
+# Format: [RESPONSE_MOVE, int : numéro de la requête, tuple : coordonnées
+#          (x, y) du coup (None si aucun coup possible)]
+#         [RESPONSE_ANALYSIS, int : numéro de la requête, int : profondeur,
+#          list : [(int : case d'un coup, int : valeur du coup), ...]]
+RESPONSE_MOVE     = 0  # Coup à jouer trouvé par une recherche
+RESPONSE_ANALYSIS = 1  # Valeur de chaque coup, après chaque profondeur
+
+# ============================================================================ #
+# GLOBALES                                                                     #
+# ============================================================================ #
+
+# Processus de recherche et ses files de messages (None s'il n'est pas lancé)
+Process = None
+Requests = None
+Responses = None
+
+# Numéro de la dernière requête de recherche envoyée, les réponses aux requêtes
+# précédentes sont ignorées
+SearchId = 0
+
+# Coup renvoyé par la dernière recherche terminée (voir Poll())
+Result = None
+
+# Position de la recherche demandée par RequestMove() et encore sans réponse,
+# pour pouvoir choisir un coup si le processus de recherche s'arrête avant de
+# répondre (voir FallbackMove())
+# Format: (int : pions du joueur, int : pions de l'adversaire) ou None
+Position = None
+
+# Évaluation des coups du joueur humain par la réflexion anticipée, mise à jour
+# par Poll() à chaque profondeur terminée (le dictionnaire est modifié sur
+# place et peut donc être transmis une fois pour toutes à l'affichage)
+# Format: {tuple : coordonnées (x, y) du coup : str : valeur (voir
+#          FormatScore())}
+Analysis = {}
+
+# Compteur incrémenté à chaque modification de Analysis, pour savoir s'il faut
+# la réafficher
+AnalysisVersion = 0
+
+# Table de transpositions du processus de recherche : les positions déjà
+# évaluées, gardées d'une requête à l'autre pour que le coup joué par le
+# joueur humain profite de la réflexion anticipée
+# Format: {int : pions du joueur << 64 | pions de l'adversaire :
+#          (int : profondeur, int : valeur, int : type BOUND_*, int : case du
+#           meilleur coup (None si aucun), int : nombre de pions)}
+Table = {}
+
+# ============================================================================ #
+# FONCTIONS (PROCESSUS DE RECHERCHE)                                           #
+# ============================================================================ #
+
+class SearchStopped(Exception):
+# Exception levée au milieu d'une recherche quand une requête arrive et qu'elle
+# doit s'arrêter
+    pass
+
+# ============================================================================ #
+
+def ToBitboards(board, color):
+# Fonction qui convertit un plateau en deux entiers de 64 bits : les pions du
+# joueur et ceux de son adversaire
+# PARAMÈTRES:
+#     board : tableau 2D qui correspond aux cases du plateau
+#     color : couleur des pions du joueur
+
+    player = 0
+    opponent = 0
+    for y in range(8):
+        for x in range(8):
+            if board[y][x] == color:
+                player |= 1 << (y*8 + x)
+            elif board[y][x] != game.TILE_EMPTY:
+                opponent |= 1 << (y*8 + x)
+    return player, opponent
+
+# ============================================================================ #
+
+def Shift(disks, shift, mask):
+# Fonction qui déplace des pions d'une case dans une direction (voir DIRECTIONS)
+# PARAMÈTRES:
+#     disks : pions à déplacer
+#     shift : décalage de la direction
+#     mask : masque de la direction
+
+    if shift > 0:
+        return (disks << shift) & mask & FULL
+    return (disks >> -shift) & mask
+
+# ============================================================================ #
+
+def GetMoves(player, opponent):
+# Fonction qui renvoie les cases où le joueur peut jouer (un bit par case) : les
+# cases vides qui prolongent une ligne de pions adverses partant d'un de ses
+# pions
+# PARAMÈTRES:
+#     player : pions du joueur
+#     opponent : pions de l'adversaire
+
+    empty = ~(player | opponent) & FULL
+    moves = 0
+    for shift, mask in DIRECTIONS:
+        line = Shift(player, shift, mask) & opponent
+        # Une ligne de pions adverses compte au plus 6 pions
+        for i in range(5):
+            line |= Shift(line, shift, mask) & opponent
+        moves |= Shift(line, shift, mask) & empty
+    return moves
+
+# ============================================================================ #
+
+def GetFlips(player, opponent, square):
+# Fonction qui renvoie les pions adverses retournés si le joueur joue sur une
+# case (équivalent de game.GetMiddleDisks() pour les entiers de 64 bits)
+# PARAMÈTRES:
+#     player : pions du joueur
+#     opponent : pions de l'adversaire
+#     square : indice y*8 + x de la case jouée
+
+    flips = 0
+    for shift, mask in DIRECTIONS:
+        line = 0
+        disk = Shift(1 << square, shift, mask)
+        while disk & opponent:
+            line |= disk
+            disk = Shift(disk, shift, mask)
+        if disk & player:
+            flips |= line
+    return flips
+
+# ============================================================================ #
+
+def Squares(disks):
+# Fonction qui renvoie la liste des indices des cases d'un ensemble de pions
+# PARAMÈTRES:
+#     disks : ensemble de pions (un bit par case)
+
+    squares = []
+    while disks:
+        bit = disks & -disks
+        squares.append(bit.bit_length() - 1)
+        disks ^= bit
+    return squares
+
+# ============================================================================ #
+
+def Evaluate(player, opponent):
+# Fonction qui évalue une position du point de vue du joueur : valeur des cases
+# occupées (WEIGHTS), différence de mobilité et de pions stables
+# PARAMÈTRES:
+#     player : pions du joueur
+#     opponent : pions de l'adversaire
+
+    score = 0
+    for square in Squares(player):
+        score += WEIGHTS[square]
+    for square in Squares(opponent):
+        score -= WEIGHTS[square]
+    mobility = bin(GetMoves(player, opponent)).count("1") \
+             - bin(GetMoves(opponent, player)).count("1")
+    stable = stability.CountStableDisks(player, opponent) \
+           - stability.CountStableDisks(opponent, player)
+    return score + MOBILITY_WEIGHT * mobility + STABILITY_WEIGHT * stable
+
+# ============================================================================ #
+
+def OrderMoves(moves):
+# Fonction qui renvoie les cases d'un ensemble de coups, les plus prometteuses
+# (selon WEIGHTS) en premier pour que l'élagage alpha-bêta coupe plus tôt
+# PARAMÈTRES:
+#     moves : ensemble des coups (un bit par case)
+
+    return sorted(Squares(moves), key=lambda square: -WEIGHTS[square])
+
+# ============================================================================ #
+
+def Negamax(search, player, opponent, depth, alpha, beta, passed):
+# Fonction qui renvoie la valeur d'une position du point de vue du joueur, en
+# explorant les coups sur une profondeur donnée (algorithme negamax avec
+# élagage alpha-bêta et table de transpositions)
+# PARAMÈTRES:
+#     search : état de la recherche (voir Search())
+#     player : pions du joueur
+#     opponent : pions de l'adversaire
+#     depth : profondeur restante à explorer
+#     alpha : valeur minimale garantie au joueur
+#     beta : valeur maximale que l'adversaire laissera au joueur
+#     passed : booléen indiquant que l'adversaire vient de passer son tour
+
+    # On lit de temps en temps la file des requêtes pour pouvoir s'arrêter
+    search["nodes"] += 1
+    if search["nodes"] % POLL_NODES == 0:
+        CheckRequests(search)
+
+    # Si la position a déjà été évaluée assez profondément, sa valeur (ou une
+    # borne suffisante) est réutilisée. Sinon son meilleur coup est examiné en
+    # premier.
+    key = player << 64 | opponent
+    entry = Table.get(key)
+    hashMove = None
+    if entry != None:
+        if entry[0] >= depth:
+            if entry[2] == BOUND_EXACT \
+            or (entry[2] == BOUND_LOWER and entry[1] >= beta) \
+            or (entry[2] == BOUND_UPPER and entry[1] <= alpha):
+                return entry[1]
+        hashMove = entry[3]
+
+    # Si la recherche va jusqu'à la fin de la partie, les pions stables de
+    # l'adversaire lui restent : le joueur ne peut pas finir avec plus de
+    # 64 - 2*(pions stables de l'adversaire) pions d'écart. Si cela ne suffit
+    # pas à dépasser alpha, inutile d'explorer la position.
+    if depth >= 64 - bin(player | opponent).count("1"):
+        bound = WIN_SCORE * (64 - 2*stability.CountStableDisks(opponent,
+                                                                player))
+        if bound <= alpha:
+            return bound
+
+    moves = GetMoves(player, opponent)
+    if moves == 0:
+        # Aucun des deux joueurs ne peut jouer : fin de la partie
+        if passed:
+            return WIN_SCORE * (bin(player).count("1")
+                                - bin(opponent).count("1"))
+        return -Negamax(search, opponent, player, depth, -beta, -alpha, True)
+
+    if depth == 0:
+        return Evaluate(player, opponent)
+
+    lowerBound = alpha
+    best = -INFINITY
+    bestMove = None
+    squares = OrderMoves(moves)
+    if hashMove in squares:
+        squares.remove(hashMove)
+        squares.insert(0, hashMove)
+    for square in squares:
+        flips = GetFlips(player, opponent, square)
+        score = -Negamax(search, opponent & ~flips,
+                         player | flips | (1 << square), depth - 1,
+                         -beta, -alpha, False)
+        if score > best:
+            best = score
+            bestMove = square
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+
+    if best <= lowerBound:
+        bound = BOUND_UPPER
+    elif best >= beta:
+        bound = BOUND_LOWER
+    else:
+        bound = BOUND_EXACT
+    Store(key, depth, best, bound, bestMove)
+    return best
+
+# ============================================================================ #
+
+def Store(key, depth, score, bound, bestMove):
+# Fonction qui enregistre l'évaluation d'une position dans la table de
+# transpositions. Les positions à moins de 2 coups de la fin de la recherche
+# ne sont pas gardées (elles sont les plus nombreuses et les moins coûteuses à
+# réévaluer) ; une fois la table pleine, seules les positions déjà présentes
+# sont mises à jour (voir Prune()).
+# PARAMÈTRES:
+#     key : clé de la position (voir Table)
+#     depth : profondeur de l'évaluation
+#     score : valeur de la position
+#     bound : type de la valeur (BOUND_*)
+#     bestMove : case du meilleur coup
+
+    if depth < 2 or (len(Table) >= TABLE_SIZE and key not in Table):
+        return
+    disks = bin(key).count("1")
+    Table[key] = (depth, score, bound, bestMove, disks)
+
+# ============================================================================ #
+
+def Prune(player, opponent):
+# Fonction qui retire de la table de transpositions les positions qui ne
+# peuvent plus arriver : le nombre de pions augmente à chaque coup, les
+# positions qui en ont moins que la position actuelle sont donc dépassées
+# PARAMÈTRES:
+#     player : pions du joueur dans la position actuelle
+#     opponent : pions de l'adversaire dans la position actuelle
+
+    disks = bin(player | opponent).count("1")
+    for key in [key for key, entry in Table.items() if entry[4] < disks]:
+        del Table[key]
+
+# ============================================================================ #
+
+def CheckRequests(search):
+# Fonction qui traite les requêtes arrivées pendant une recherche et lève
+# SearchStopped si elle doit s'arrêter. REQUEST_MOVE_NOW arrête la recherche
+# avec le meilleur coup trouvé, toute autre requête l'abandonne et sera
+# traitée ensuite par Worker().
+# PARAMÈTRES:
+#     search : état de la recherche (voir Search())
+
+    if time.perf_counter() >= search["deadline"]:
+        raise SearchStopped()
+    try:
+        request = search["requests"].get_nowait()
+    except queue.Empty:
+        return
+    if request[0] != REQUEST_MOVE_NOW:
+        search["pending"] = request
+    raise SearchStopped()
+
+# ============================================================================ #
+
+def Search(search, player, opponent):
+# Fonction qui cherche le meilleur coup du joueur par approfondissement
+# itératif : une recherche complète à la profondeur 1, puis 2, etc. jusqu'à la
+# fin du temps de réflexion ou une requête qui l'arrête. Renvoie l'indice de
+# la case du meilleur coup trouvé par la dernière profondeur terminée (None si
+# aucun coup possible).
+# PARAMÈTRES:
+#     search : état de la recherche
+#         Format: {"requests" : file des requêtes, "deadline" : float : fin du
+#                  temps de réflexion (time.perf_counter()), "nodes" : int :
+#                  positions examinées, "pending" : requête arrivée pendant la
+#                  recherche et à traiter ensuite (None si aucune)}
+#     player : pions du joueur
+#     opponent : pions de l'adversaire
+
+    moves = OrderMoves(GetMoves(player, opponent))
+    if len(moves) == 0:
+        return None
+    bestMove = moves[0]
+    if len(moves) == 1:
+        return bestMove
+
+    # Si la position a été évaluée pendant la réflexion anticipée, on reprend
+    # à partir de la profondeur atteinte, voire on joue directement son
+    # meilleur coup
+    firstDepth = 1
+    entry = Table.get(player << 64 | opponent)
+    if entry != None and entry[2] == BOUND_EXACT and entry[3] in moves:
+        bestMove = entry[3]
+        if entry[0] >= PONDER_HIT_DEPTH:
+            return bestMove
+        firstDepth = entry[0] + 1
+
+    try:
+        for depth in range(firstDepth, MAX_DEPTH + 1):
+            alpha = -INFINITY
+            depthBest = None
+            # Le meilleur coup de la profondeur précédente est examiné en
+            # premier
+            for square in [bestMove] + [m for m in moves if m != bestMove]:
+                flips = GetFlips(player, opponent, square)
+                score = -Negamax(search, opponent & ~flips,
+                                 player | flips | (1 << square), depth - 1,
+                                 -INFINITY, -alpha, False)
+                if score > alpha:
+                    alpha = score
+                    depthBest = square
+            bestMove = depthBest
+            Store(player << 64 | opponent, depth, alpha, BOUND_EXACT,
+                  bestMove)
+            # Au delà du nombre de cases vides, la profondeur ne change rien
+            if depth >= 64 - bin(player | opponent).count("1"):
+                break
+    except SearchStopped:
+        pass
+    return bestMove
+
+# ============================================================================ #
+
+def PonderSearch(search, player, opponent, requestId, responses):
+# Fonction de réflexion anticipée : pendant que le joueur humain choisit son
+# coup, chacun de ses coups possibles est évalué par approfondissement
+# itératif, avec une fenêtre alpha-bêta complète pour que la réponse de
+# l'ordinateur à chacun d'eux soit exacte. Les positions évaluées restent
+# dans la table de transpositions : quel que soit le coup joué, la recherche
+# suivante (voir Search()) repart de ce qui a déjà été calculé. La valeur de
+# chaque coup est envoyée au jeu après chaque profondeur terminée
+# (RESPONSE_ANALYSIS). La réflexion continue jusqu'à ce qu'une requête
+# l'arrête.
+# PARAMÈTRES:
+#     search : état de la recherche (voir Search())
+#     player : pions du joueur humain
+#     opponent : pions de l'ordinateur
+#     requestId : numéro de la requête
+#     responses : file des réponses renvoyées au jeu
+
+    moves = OrderMoves(GetMoves(player, opponent))
+    if len(moves) == 0:
+        return
+
+    try:
+        for depth in range(1, MAX_DEPTH + 1):
+            scores = []
+            for square in moves:
+                flips = GetFlips(player, opponent, square)
+                scores.append((square, -Negamax(search, opponent & ~flips,
+                                                player | flips | (1 << square),
+                                                depth - 1, -INFINITY, INFINITY,
+                                                False)))
+            responses.put([RESPONSE_ANALYSIS, requestId, depth, scores])
+            if depth >= 64 - bin(player | opponent).count("1"):
+                break
+    except SearchStopped:
+        pass
+
+# ============================================================================ #
+
+def Worker(requests, responses):
+# Fonction principale du processus de recherche : elle traite les requêtes dans
+# l'ordre où elles arrivent jusqu'à REQUEST_QUIT
+# PARAMÈTRES:
+#     requests : file des requêtes envoyées par le jeu
+#     responses : file des réponses renvoyées au jeu
+
+    pending = None
+    while True:
+        request = pending if pending != None else requests.get()
+        pending = None
+
+        if request[0] == REQUEST_QUIT:
+            return
+        if request[0] == REQUEST_SEARCH:
+            Prune(request[2], request[3])
+            search = {"requests": requests, "nodes": 0, "pending": None,
+                      "deadline": time.perf_counter() + request[4]}
+            square = Search(search, request[2], request[3])
+            pending = search["pending"]
+            # Une recherche interrompue par une autre requête est abandonnée
+            if pending == None:
+                move = None if square == None else (square % 8, square // 8)
+                responses.put([RESPONSE_MOVE, request[1], move])
+        elif request[0] == REQUEST_PONDER:
+            Prune(request[2], request[3])
+            search = {"requests": requests, "nodes": 0, "pending": None,
+                      "deadline": float("inf")}
+            PonderSearch(search, request[2], request[3], request[1],
+                         responses)
+            pending = search["pending"]
+        # REQUEST_MOVE_NOW et REQUEST_CANCEL ne concernent qu'une recherche en
+        # cours : reçus entre deux recherches, ils sont sans effet
+
+# ============================================================================ #
+# FONCTIONS (JEU)                                                              #
+# ============================================================================ #
+
+def Start():
+# Fonction qui lance le processus de recherche s'il ne l'est pas déjà
+# AUCUN PARAMÈTRE
+
+    global Process, Requests, Responses
+
+    if Process != None:
+        return
+    # Le processus est créé à partir d'un nouvel interpréteur ("spawn") sur
+    # tous les systèmes : il n'hérite ni de la fenêtre ni des librairies de la
+    # SDL chargées par le jeu
+    context = multiprocessing.get_context("spawn")
+    Requests = context.Queue()
+    Responses = context.Queue()
+    Process = context.Process(target=Worker, args=(Requests, Responses),
+                              daemon=True)
+    Process.start()
+
+# ============================================================================ #
+
+def RequestMove(board, color, seconds=THINK_TIME):
+# Fonction qui demande au processus de recherche le coup à jouer par un joueur.
+# Le résultat est récupéré plus tard avec Poll(). Une recherche précédente
+# encore en cours est abandonnée.
+# PARAMÈTRES:
+#     board : tableau 2D qui correspond aux cases du plateau
+#     color : couleur des pions du joueur
+#     seconds : temps de réflexion maximal (en secondes)
+
+    global SearchId, Result, Position
+
+    SearchId += 1
+    Result = None
+    ClearAnalysis()
+    player, opponent = ToBitboards(board, color)
+    Position = (player, opponent)
+    # Sans processus de recherche, Poll() choisira le coup sur place
+    if Process != None:
+        Requests.put([REQUEST_SEARCH, SearchId, player, opponent, seconds])
+
+# ============================================================================ #
+
+def Ponder(board, color):
+# Fonction qui demande au processus de recherche, s'il est lancé, de réfléchir
+# pendant que le joueur humain choisit son coup (voir PonderSearch()). La
+# réflexion s'arrête à la requête suivante, l'évaluation des coups du joueur
+# arrive au fur et à mesure dans Analysis (voir Poll()).
+# PARAMÈTRES:
+#     board : tableau 2D qui correspond aux cases du plateau
+#     color : couleur des pions du joueur humain
+
+    global SearchId, Position
+
+    if Process == None:
+        return
+    SearchId += 1
+    Position = None
+    ClearAnalysis()
+    player, opponent = ToBitboards(board, color)
+    Requests.put([REQUEST_PONDER, SearchId, player, opponent])
+
+# ============================================================================ #
+
+def ClearAnalysis():
+# Fonction qui efface l'évaluation des coups de la position précédente
+# AUCUN PARAMÈTRE
+
+    global AnalysisVersion
+
+    if len(Analysis) > 0:
+        Analysis.clear()
+        AnalysisVersion += 1
+
+# ============================================================================ #
+
+def FormatScore(score):
+# Fonction qui renvoie le texte affiché pour la valeur d'un coup : la valeur de
+# l'évaluation signée (ex: "+12"), ou l'écart de pions final précédé de "="
+# quand la recherche a atteint la fin de la partie (ex: "=+8")
+# PARAMÈTRES:
+#     score : valeur du coup du point de vue du joueur qui le joue
+
+    if abs(score) >= WIN_SCORE:
+        return "={:+d}".format(round(score / WIN_SCORE))
+    return "{:+d}".format(score)
+
+# ============================================================================ #
+
+def MoveNow():
+# Fonction qui demande au processus de recherche de jouer tout de suite le
+# meilleur coup trouvé jusque là
+# AUCUN PARAMÈTRE
+
+    if Process != None:
+        Requests.put([REQUEST_MOVE_NOW])
+
+# ============================================================================ #
+
+def Cancel():
+# Fonction qui abandonne la recherche en cours : elle ne renverra pas de coup
+# AUCUN PARAMÈTRE
+
+    global SearchId, Position
+
+    SearchId += 1
+    Position = None
+    ClearAnalysis()
+    if Process != None:
+        Requests.put([REQUEST_CANCEL])
+
+# ============================================================================ #
+
+def FallbackMove(player, opponent):
+# Fonction qui choisit sur place, sans recherche, le coup d'un joueur quand le
+# processus de recherche ne peut pas répondre : le coup sur la case la mieux
+# placée selon WEIGHTS. Renvoie ses coordonnées (x, y), ou None si le joueur
+# ne peut pas jouer.
+# PARAMÈTRES:
+#     player : pions du joueur
+#     opponent : pions de l'adversaire
+
+    squares = OrderMoves(GetMoves(player, opponent))
+    if len(squares) == 0:
+        return None
+    return (squares[0] % 8, squares[0] // 8)
+
+# ============================================================================ #
+
+def Poll():
+# Fonction qui lit les réponses du processus de recherche sans attendre : elle
+# met à jour Analysis avec l'évaluation des coups reçue et renvoie True quand
+# la dernière recherche demandée est terminée, son coup étant alors placé
+# dans Result. Si le processus de recherche s'est arrêté (exception, manque de
+# mémoire, processus tué...), il n'est plus utilisé et le coup demandé est
+# choisi par FallbackMove() pour que la partie ne reste pas bloquée.
+# AUCUN PARAMÈTRE
+
+    global Result, AnalysisVersion, Position
+
+    if Process != None:
+        while True:
+            try:
+                response = Responses.get_nowait()
+            except queue.Empty:
+                break
+            # Les réponses aux requêtes abandonnées sont ignorées
+            if response[1] != SearchId:
+                continue
+            if response[0] == RESPONSE_MOVE:
+                Result = response[2]
+                Position = None
+                return True
+            if response[0] == RESPONSE_ANALYSIS:
+                for square, score in response[3]:
+                    Analysis[(square % 8, square // 8)] = FormatScore(score)
+                AnalysisVersion += 1
+        # Le processus est vérifié après avoir vidé la file : il a pu envoyer
+        # sa réponse juste avant de s'arrêter
+        if Process.is_alive():
+            return False
+        Stop()
+
+    if Position == None:
+        return False
+    Result = FallbackMove(*Position)
+    Position = None
+    return True
+
+# ============================================================================ #
+
+def Stop():
+# Fonction qui arrête le processus de recherche
+# AUCUN PARAMÈTRE
+
+    global Process, Requests, Responses
+
+    if Process == None:
+        return
+    Requests.put([REQUEST_QUIT])
+    Process.join(1)
+    if Process.is_alive():
+        Process.terminate()
+    Process = None
+    Requests = None
+    Responses = None
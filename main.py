@@ -5,6 +5,10 @@
 #                                                                              #
 ################################################################################
 
+# Le module startup est importé en premier : il sert de référence pour mesurer
+# la durée du démarrage
+import startup
+
 # (Pour Windows) Configuration du chemin d'accès des DLLs de la SDL2 en fonction
 # de l'architecture utilisée par Python
 import platform, os
@@ -12,64 +16,134 @@ if platform.system() == "Windows":
     os.environ["PYSDL2_DLL_PATH"] = os.getcwd() + "\\sdl2-dll-" \
                                   + platform.architecture()[0]
 
-import copy
-import game, ui
-
 # ============================================================================ #
 # PROGRAMME PRINCIPAL                                                          #
 # ============================================================================ #
 
-# Initialisation de l'interface graphique
-ui.Init()
+# Le programme n'est exécuté que si ce fichier est lancé directement : le
+# processus de recherche du module engine le réimporte sans l'exécuter
+if __name__ == "__main__":
+    import argparse, copy
+
+    # Import de sdl2 (recherche et chargement des librairies, liaison des
+    # fonctions), mesuré à part car c'est une étape coûteuse du démarrage
+    start = startup.Start()
+    import sdl2
+    startup.Record("import sdl2", start)
+
+    start = startup.Start()
+    import display, engine, game, timing, ui
+    startup.Record("import des modules du jeu", start)
+
+    # Options de la ligne de commande
+    parser = argparse.ArgumentParser(description="Jeu de l'Othello")
+    parser.add_argument("--renderer", choices=["software", "accelerated"],
+                        default="software",
+                        help="moteur de rendu de la fenêtre (logiciel par "
+                             "défaut)")
+    parser.add_argument("--computer", choices=["light", "dark"],
+                        help="couleur des pions joués par l'ordinateur (aucune "
+                             "par défaut)")
+    parser.add_argument("--analysis", action="store_true",
+                        help="affiche l'évaluation de chaque coup possible sur "
+                             "les indices")
+    parser.add_argument("--frame-stats", action="store_true",
+                        help="affiche les durées d'affichage des images en "
+                             "quittant")
+    parser.add_argument("--overlay", action="store_true",
+                        help="incruste les durées d'affichage dans la fenêtre")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="affiche la durée des étapes du démarrage en "
+                             "quittant")
+    parser.add_argument("--profile-json", metavar="FICHIER",
+                        help="enregistre la durée des étapes du démarrage au "
+                             "format JSON dans FICHIER en quittant")
+    args = parser.parse_args()
+    timing.Overlay = args.overlay
+    ui.ShowAnalysis = args.analysis
+
+    # Couleur des pions du joueur ordinateur (None si les deux joueurs sont
+    # humains). Le processus de recherche, qui sert aussi à l'évaluation des
+    # coups, est lancé avant d'ouvrir la fenêtre.
+    computerColor = None
+    if args.computer == "light":
+        computerColor = game.TILE_LIGHT
+    elif args.computer == "dark":
+        computerColor = game.TILE_DARK
+    if computerColor != None or args.analysis:
+        engine.Start()
+
+    # Initialisation de l'interface graphique avec le moteur de rendu choisi
+    if args.renderer == "accelerated":
+        ui.Init(display.RENDERER_ACCELERATED)
+    else:
+        ui.Init(display.RENDERER_SOFTWARE)
+
+    # Boucle principale du jeu, continue tant que l'utilisateur n'a pas fermé
+    # le jeu
+    running = True
+    while running:
+        # On (ré)initialise les variables de la partie:
+        # On copie le tableau du plateau de départ
+        board = copy.deepcopy(game.BOARD_INIT)
+        # Le joueur noir commence en premier
+        playerColor = game.TILE_DARK
 
-# Boucle principale du jeu, continue tant que l'utilisateur n'a pas fermé le jeu
-running = True
-while running:
-    # On (ré)initialise les variables de la partie:
-    # On copie le tableau du plateau de départ
-    board = copy.deepcopy(game.BOARD_INIT)
-    # Le joueur noir commence en premier
-    playerColor = game.TILE_DARK
+        # Boucle d'une partie, continue tant que la partie n'est pas finie
+        gameover = False
+        while running and not gameover:
+            # On récupère la liste des possibilités de jeu pour ce tour
+            possibilities = game.GetPlayPossibilities(board, playerColor)
 
-    # Boucle d'une partie, continue tant que la partie n'est pas finie
-    gameover = False
-    while running and not gameover:
-        # On récupère la liste des possibilités de jeu pour ce tour
-        possibilities = game.GetPlayPossibilities(board, playerColor)
+            # Si le joueur peut jouer ce tour
+            if len(possibilities) > 0:
+                # On attend que le joueur (ou l'ordinateur) pose un pion
+                if playerColor == computerColor:
+                    play = ui.WaitComputer(board, playerColor)
+                else:
+                    play = ui.WaitPlay(board, possibilities, playerColor)
 
-        # Si le joueur peut jouer ce tour
-        if len(possibilities) > 0:
-            # On attend que le joueur pose un pion
-            play = ui.WaitPlay(board, possibilities, playerColor)
+                # Si l'utilisateur a fermé la fenêtre on termine la partie et
+                # le programme
+                if play == ui.SIG_CLOSE_WINDOW:
+                    running = False
+                else:
+                    # On place le pion du joueur dans le tableau du plateau
+                    board[play[1]][play[0]] = playerColor
+                    # On obtient la liste des pions qui sont retournés avec ce
+                    # tour
+                    middleDisks = game.GetMiddleDisks(board, play[0], play[1],
+                                                      playerColor)
+                    # On "retourne" chacun de ces pions dans le tableau du
+                    # plateau
+                    for middleDisk in middleDisks:
+                        board[middleDisk[1]][middleDisk[0]] = playerColor
+            # Sinon, si l'autre joueur ne peut pas jouer non plus, la partie
+            # est terminée
+            elif len(game.GetPlayPossibilities(board,
+                                      game.SwitchPlayer(playerColor))) == 0:
+                # On affiche l'interface avec les scores des joueurs, si
+                # l'utilisateur a décidé d'arrêter de jouer, on termine le
+                # programme. Sinon, la boucle de la partie s'arrête, et une
+                # nouvelle partie est lancée
+                if ui.DisplayScores(board, game.GetScore(board)) \
+                                                     == ui.SIG_CLOSE_WINDOW:
+                    running = False
+                else:
+                    gameover = True
+            # On passe au joueur suivant avant de passer au tour suivant
+            playerColor = game.SwitchPlayer(playerColor)
 
-            # Si l'utilisateur a fermé la fenêtre on termine la partie et le
-            # programme
-            if play == ui.SIG_CLOSE_WINDOW:
-                running = False
-            else:
-                # On place le pion du joueur dans le tableau du plateau
-                board[play[1]][play[0]] = playerColor
-                # On obtient la liste des pions qui sont retournés avec ce tour
-                middleDisks = game.GetMiddleDisks(board, play[0], play[1],
-                                                  playerColor)
-                # On "retourne" chacun de ces pions dans le tableau du plateau
-                for middleDisk in middleDisks:
-                    board[middleDisk[1]][middleDisk[0]] = playerColor
-        # Sinon, si l'autre joueur ne peut pas jouer non plus, la partie est
-        # terminée
-        elif len(game.GetPlayPossibilities(board,
-                                          game.SwitchPlayer(playerColor))) == 0:
-            # On affiche l'interface avec les scores des joueurs, si
-            # l'utilisateur a décidé d'arrêter de jouer, on termine le programme
-            # Sinon, la boucle de la partie s'arrête, et une nouvelle partie est
-            # lancée
-            if ui.DisplayScores(board, game.GetScore(board)) \
-                                                         == ui.SIG_CLOSE_WINDOW:
-                running = False
-            else:
-                gameover = True
-        # On passe au joueur suivant avant de passer au tour suivant
-        playerColor = game.SwitchPlayer(playerColor)
+    # On ferme la fenêtre, on nettoie la mémoire utilisée par l'interface et on
+    # arrête le processus de recherche de l'ordinateur
+    ui.Quit()
+    engine.Stop()
 
-# On ferme la fenêtre et on nettoie la mémoire utilisée par l'interface
-ui.Quit()
+    # On affiche les statistiques d'affichage et du démarrage si elles ont été
+    # demandées
+    if args.frame_stats:
+        print(timing.Report())
+    if args.profile_startup:
+        print(startup.Report())
+    if args.profile_json:
+        startup.WriteJSON(args.profile_json)
@@ -2,34 +2,19 @@
 from .dll import get_dll_file, _bind
 from ctypes import c_int as _cint
 
-from .audio import *
 from .blendmode import *
-from .clipboard import *
-from .cpuinfo import *
-from .endian import *
 from .error import *
 from .events import *
-from .filesystem import *
-from .gamecontroller import *
 from .gesture import *
-from .haptic import *
-from .hints import *
 from .joystick import *
 from .keyboard import *
-from .loadso import *
-from .log import *
-from .messagebox import *
 from .mouse import *
 from .pixels import *
-from .platform import *
-from .power import *
 from .rect import *
 from .render import *
 from .rwops import *
-from .shape import *
 from .stdinc import *
 from .surface import *
-from .syswm import *
 from .timer import *
 from .touch import *
 from .version import *
@@ -38,6 +23,62 @@ from .video import *
 from .keycode import *
 from .scancode import *
 
+# Submodules that most programs do not need are only imported (and their
+# functions bound) the first time one of their names is looked up, e.g. via
+# sdl2.SDL_OpenAudio or "from sdl2 import SDL_OpenAudio". As a consequence,
+# "from sdl2 import *" only exports the names of the modules imported above.
+# They must not be imported by any of those modules (events.py imports
+# keyboard, joystick, touch and gesture, which are therefore loaded eagerly).
+_LAZY_MODULES = ("audio", "clipboard", "cpuinfo", "endian", "filesystem",
+                 "gamecontroller", "haptic", "hints", "loadso", "log",
+                 "messagebox", "platform", "power", "shape", "syswm")
+
+# Maps each name exported by a lazy submodule to that submodule, so that only
+# the submodule owning a name is imported. Built on first use by reading the
+# __all__ lists from the sources, without importing anything.
+# Format: {name: submodule name}
+_lazy_names = None
+
+
+def _get_lazy_names():
+    """Gets the name to lazy submodule map, building it if necessary."""
+    global _lazy_names
+    if _lazy_names is None:
+        import os
+        import re
+        lazy_names = {}
+        for modname in _LAZY_MODULES:
+            path = os.path.join(os.path.dirname(__file__), modname + ".py")
+            with open(path) as fp:
+                match = re.search(r"^__all__ = (\[.*?\])", fp.read(),
+                                  re.MULTILINE | re.DOTALL)
+            # Like consecutive star imports, later modules win
+            for name in re.findall(r"[\"'](\w+)[\"']", match.group(1)):
+                lazy_names[name] = modname
+        _lazy_names = lazy_names
+    return _lazy_names
+
+
+def __getattr__(name):
+    # Special names (__all__, __path__, ...) are looked up by the import
+    # machinery itself and must not trigger any import.
+    modname = None
+    if not name.startswith("__"):
+        modname = _get_lazy_names().get(name)
+    if modname is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    from importlib import import_module
+    module = import_module("." + modname, __name__)
+    for modattr, owner in _get_lazy_names().items():
+        if owner == modname:
+            globals().setdefault(modattr, getattr(module, modattr))
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_get_lazy_names()))
+
+
 # At least Win32 platforms need this now.
 _SDL_SetMainReady = _bind("SDL_SetMainReady")
 _SDL_SetMainReady()
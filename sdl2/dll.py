@@ -1,6 +1,8 @@
 """DLL wrapper"""
+import json
 import os
 import sys
+import time
 import warnings
 from ctypes import CDLL
 from ctypes.util import find_library
@@ -8,8 +10,92 @@ from ctypes.util import find_library
 __all__ = ["DLL", "nullfunc"]
 
 
-def _findlib(libnames, path=None):
-    """."""
+# Loader cache updated by ldconfig on Linux; find_library() returns plain
+# library names (e.g. "libSDL2-2.0.so.0") resolved through it.
+_LDCONFIG_CACHE = "/etc/ld.so.cache"
+
+# Results of find_library(), loaded from and saved to the persistent cache
+# file on first use (see _cache_file()).
+_found_cache = None
+
+
+def _cache_file():
+    """Gets the path of the persistent find_library() cache file, or None if
+    the cache is disabled (PYSDL2_DLL_CACHE set to an empty string)."""
+    path = os.getenv("PYSDL2_DLL_CACHE")
+    if path is not None:
+        return path or None
+    base = os.getenv("XDG_CACHE_HOME") or \
+        os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pysdl2", "dllcache.json")
+
+
+def _stamp(libfile):
+    """Gets the [file, mtime] pair used to check that a find_library() result
+    is still valid: the library itself for absolute paths, the loader cache
+    for plain library names. Returns None if there is nothing to check."""
+    stampfile = libfile if os.path.isabs(libfile) else _LDCONFIG_CACHE
+    try:
+        return [stampfile, os.stat(stampfile).st_mtime]
+    except OSError:
+        return None
+
+
+def _find_library_cached(libname, refresh=False):
+    """find_library() wrapper consulting the persistent cache first.
+
+    find_library() spawns ldconfig or gcc on Linux, which is slow. Results are
+    stored along with the modification time of the file they depend on, and
+    are discarded as soon as it changes (library replaced, ldconfig run).
+    The key includes the library search path variables that find_library()
+    also honours. Missing libraries are never cached, so that a library
+    installed later is found without any ldconfig run. Only the
+    find_library() lookups are cached: the PYSDL2_DLL_PATH lookups of
+    _findlib() are simple file checks.
+
+    If refresh is True, the cached entry is ignored and replaced by a new
+    lookup.
+    """
+    global _found_cache
+    cachefile = _cache_file()
+    if cachefile is None:
+        return find_library(libname)
+    if _found_cache is None:
+        try:
+            with open(cachefile) as fp:
+                _found_cache = json.load(fp)
+        except (OSError, ValueError):
+            _found_cache = {}
+    key = "%s:%s:%s:%s" % (sys.platform, libname,
+                           os.getenv("LD_LIBRARY_PATH", ""),
+                           os.getenv("DYLD_LIBRARY_PATH", ""))
+    entry = _found_cache.get(key)
+    if not refresh and entry is not None and entry[0] and \
+            _stamp(entry[0]) == entry[1]:
+        return entry[0]
+
+    libfile = find_library(libname)
+    if not libfile:
+        # Not cached, but drop a stale entry pointing to a removed library
+        _found_cache.pop(key, None)
+        return libfile
+    stamp = _stamp(libfile)
+    if stamp is not None:
+        _found_cache[key] = [libfile, stamp]
+        try:
+            os.makedirs(os.path.dirname(cachefile), exist_ok=True)
+            with open(cachefile + ".tmp", "w") as fp:
+                json.dump(_found_cache, fp)
+            os.replace(cachefile + ".tmp", cachefile)
+        except OSError:
+            # The cache is only an optimisation
+            pass
+    return libfile
+
+
+def _findlib(libnames, path=None, refresh=False):
+    """Gets the library files matching libnames, from path first and then
+    from the system search path (see _find_library_cached() for refresh)."""
     platform = sys.platform
     if platform in ("win32", "cli"):
         pattern = "%s.dll"
@@ -34,7 +120,7 @@ def _findlib(libnames, path=None):
                 if os.path.exists(dllfile):
                     results.append(dllfile)
     for libname in searchfor:
-        dllfile = find_library(libname)
+        dllfile = _find_library_cached(libname, refresh)
         if dllfile:
             results.append(dllfile)
     return results
@@ -45,8 +131,13 @@ class DLL(object):
     instantiate this one directly from your user code.
     """
     def __init__(self, libinfo, libnames, path=None):
+        start = time.perf_counter()
         self._dll = None
+        self._bind_times = []
         foundlibs = _findlib(libnames, path)
+        if len(foundlibs) == 0:
+            # The persistent cache may be outdated: look again without it
+            foundlibs = _findlib(libnames, path, refresh=True)
         dllmsg = "PYSDL2_DLL_PATH: %s" % (os.getenv("PYSDL2_DLL_PATH") or "unset")
         if len(foundlibs) == 0:
             raise RuntimeError("could not find any library for %s (%s)" %
@@ -66,14 +157,18 @@ class DLL(object):
         if path is not None and sys.platform in ("win32", "cli") and \
             path in self._libfile:
             os.environ["PATH"] = "%s;%s" % (path, os.environ["PATH"])
+        self._load_time = time.perf_counter() - start
 
     def bind_function(self, funcname, args=None, returns=None, optfunc=None):
         """Binds the passed argument and return value types to the specified
-        function."""
+        function.
+
+        A warning is only issued if the function is missing from the library
+        and optfunc is used as its replacement. The time spent binding is
+        recorded, see bind_times.
+        """
+        start = time.perf_counter()
         func = getattr(self._dll, funcname, None)
-        warnings.warn\
-            ("function '%s' not found in %r, using replacement" %
-             (funcname, self._dll), ImportWarning)
         if not func:
             if optfunc:
                 warnings.warn\
@@ -85,8 +180,23 @@ class DLL(object):
                                  (funcname, self._dll))
         func.argtypes = args
         func.restype = returns
+        # The caller is the sdl2 submodule binding the function at import time
+        module = sys._getframe(1).f_globals.get("__name__")
+        self._bind_times.append((module, funcname,
+                                 time.perf_counter() - start))
         return func
 
+    @property
+    def bind_times(self):
+        """Gets the list of (module name, function name, seconds) tuples of
+        all the functions bound so far, in binding order."""
+        return self._bind_times
+
+    @property
+    def load_time(self):
+        """Gets the time in seconds spent finding and loading the library."""
+        return self._load_time
+
     @property
     def libfile(self):
         """Gets the filename of the loaded library."""
@@ -1,4 +1,5 @@
-from ctypes import CFUNCTYPE, Structure, POINTER, c_int, c_void_p
+from ctypes import CFUNCTYPE, Structure, POINTER, c_int, c_void_p, byref, \
+    sizeof
 from .dll import _bind
 from .stdinc import Uint8, Uint32, SDL_bool
 from .blendmode import SDL_BlendMode
@@ -19,7 +20,7 @@ __all__ = ["SDL_SWSURFACE", "SDL_PREALLOC", "SDL_RLEACCEL", "SDL_DONTFREE",
            "SDL_ConvertSurfaceFormat", "SDL_ConvertPixels", "SDL_FillRect",
            "SDL_FillRects", "SDL_UpperBlit", "SDL_BlitSurface", "SDL_LowerBlit",
            "SDL_SoftStretch", "SDL_UpperBlitScaled", "SDL_BlitScaled",
-           "SDL_LowerBlitScaled"
+           "SDL_LowerBlitScaled", "blit_surfaces"
            ]
 
 SDL_SWSURFACE = 0
@@ -85,3 +86,35 @@ SDL_SoftStretch = _bind("SDL_SoftStretch", [POINTER(SDL_Surface), POINTER(SDL_Re
 SDL_UpperBlitScaled = _bind("SDL_UpperBlitScaled", [POINTER(SDL_Surface), POINTER(SDL_Rect), POINTER(SDL_Surface), POINTER(SDL_Rect)], c_int)
 SDL_BlitScaled = SDL_UpperBlitScaled
 SDL_LowerBlitScaled = _bind("SDL_LowerBlitScaled", [POINTER(SDL_Surface), POINTER(SDL_Rect), POINTER(SDL_Surface), POINTER(SDL_Rect)], c_int)
+
+
+def blit_surfaces(src, dst, rects, indices=None, srcrect=None):
+    """Blits the same source surface to several positions of a destination
+    surface.
+
+    rects must be a ctypes array of SDL_Rect (e.g. (SDL_Rect * 64)()), which
+    is passed by reference with an offset for each blit, so that no SDL_Rect
+    is allocated and the argument conversion of SDL_UpperBlit stays minimal.
+    If indices is given, only the rects at these positions of the array are
+    used, otherwise all of them are.
+
+    As with SDL_BlitSurface, the destination rects are overwritten with the
+    final (clipped) blit areas.
+
+    Returns 0 on success or the first negative error code of SDL_UpperBlit.
+    """
+    if len(rects) == 0:
+        return 0
+    blit = SDL_UpperBlit
+    # byref() needs an SDL_Rect (not the array) to satisfy the argtypes, so
+    # the first element is used as the base of the offsets.
+    base = rects[0]
+    size = sizeof(base)
+    if indices is None:
+        indices = range(len(rects))
+    result = 0
+    for index in indices:
+        ret = blit(src, srcrect, dst, byref(base, index * size))
+        if ret < 0 and result == 0:
+            result = ret
+    return result
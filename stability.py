@@ -0,0 +1,218 @@
+################################################################################
+#                                                                              #
+# stability.py : Module qui compte les pions stables d'un joueur, c'est à dire #
+#     ceux qui ne pourront plus jamais être retournés, sur les plateaux en     #
+#     entiers de 64 bits du module engine                                      #
+#                                                                              #
+# Les bords sont traités par une table précalculée de leurs 3^8 états, les     #
+# autres pions par propagation à partir des pions déjà stables                 #
+#                                                                              #
+################################################################################
+
+# ============================================================================ #
+# CONSTANTES                                                                   #
+# ============================================================================ #
+
+# Masque des 64 cases du plateau (la case (x, y) correspond au bit y*8 + x)
+FULL = 0xFFFFFFFFFFFFFFFF
+
+# Coins du plateau : sans pion dans un coin, aucun pion ne peut être stable
+CORNERS = 0x8100000000000081
+
+# Cases qui, dans chacun des 4 axes (voir AXES), ont un voisin hors du
+# plateau : colonnes de gauche et de droite pour l'axe horizontal, lignes du
+# haut et du bas pour l'axe vertical, tout le bord pour les diagonales
+WALLS = [0x8181818181818181, 0xFF000000000000FF,
+         0xFF818181818181FF, 0xFF818181818181FF]
+
+# Décalages vers les cases voisines dans les 4 axes (horizontal, vertical et
+# les deux diagonales), avec le masque qui efface les pions passés d'un bord
+# du plateau à l'autre
+# Format: [[(int : décalage, int : masque), (int : décalage, int : masque)],
+#          ...]
+AXES = [[( 1, 0xFEFEFEFEFEFEFEFE), (-1, 0x7F7F7F7F7F7F7F7F)],
+        [( 8, FULL),               (-8, FULL)],
+        [( 9, 0xFEFEFEFEFEFEFEFE), (-9, 0x7F7F7F7F7F7F7F7F)],
+        [( 7, 0x7F7F7F7F7F7F7F7F), (-7, 0xFEFEFEFEFEFEFEFE)]]
+
+# Les 4 bords du plateau, chacun donné par la liste de ses 8 cases (indices
+# y*8 + x) dans l'ordre de la table des bords
+EDGES = [[x for x in range(8)],              # Bord du haut
+         [56 + x for x in range(8)],         # Bord du bas
+         [y*8 for y in range(8)],            # Bord de gauche
+         [y*8 + 7 for y in range(8)]]        # Bord de droite
+
+# ============================================================================ #
+# GLOBALES                                                                     #
+# ============================================================================ #
+
+# Table des pions stables d'un bord pour chacun de ses 3^8 états, générée au
+# premier appel de GetStableDisks() (voir BuildEdgeTable())
+# L'état d'un bord dont le joueur occupe les cases p (8 bits) et l'adversaire
+# les cases o est à l'indice Ternary[p] + 2*Ternary[o]
+# Format: [int : cases (8 bits) des pions stables du bord, des deux couleurs]
+EdgeTable = None
+
+# Valeur en base 3 de chacun des 256 ensembles de cases d'un bord : la case i
+# y vaut 3^i
+Ternary = [sum([3**i for i in range(8) if bits >> i & 1])
+           for bits in range(256)]
+
+# Lignes du plateau dans chacun des 4 axes (voir AXES) : 8 lignes, 8 colonnes
+# et 15 diagonales dans chaque sens
+# Format: [[int : cases de la ligne, ...], ...]
+Lines = [[sum([1 << (y*8 + x) for x in range(8)]) for y in range(8)],
+         [sum([1 << (y*8 + x) for y in range(8)]) for x in range(8)],
+         [sum([1 << (y*8 + x) for y in range(8) for x in range(8)
+               if x - y == d]) for d in range(-7, 8)],
+         [sum([1 << (y*8 + x) for y in range(8) for x in range(8)
+               if x + y == d]) for d in range(15)]]
+
+# ============================================================================ #
+# FONCTIONS                                                                    #
+# ============================================================================ #
+
+def EdgeFlips(player, opponent, square):
+# Fonction qui renvoie les pions adverses d'un bord retournés quand le joueur
+# joue sur une de ses cases, en ne tenant compte que de ce bord
+# PARAMÈTRES:
+#     player : cases (8 bits) du joueur sur le bord
+#     opponent : cases (8 bits) de l'adversaire sur le bord
+#     square : position (0 à 7) de la case jouée sur le bord
+
+    flips = 0
+    for step in (1, -1):
+        line = 0
+        i = square + step
+        while 0 <= i < 8 and opponent >> i & 1:
+            line |= 1 << i
+            i += step
+        if 0 <= i < 8 and player >> i & 1:
+            flips |= line
+    return flips
+
+# ============================================================================ #
+
+def BuildEdgeTable():
+# Fonction qui génère EdgeTable. Un pion d'un bord est stable s'il garde sa
+# couleur quelle que soit la suite de coups joués sur ce bord, par l'un ou
+# l'autre joueur (un coup peut être joué sur une case du bord même s'il n'y
+# retourne rien : il peut retourner des pions dans une autre direction). Les
+# états sont traités du plus rempli au moins rempli, pour que ceux atteints
+# après un coup soient toujours déjà calculés.
+# AUCUN PARAMÈTRE
+
+    global EdgeTable
+
+    table = [0] * 3**8
+    states = [(p, o) for p in range(256) for o in range(256) if p & o == 0]
+    states.sort(key=lambda state: -bin(state[0] | state[1]).count("1"))
+    for p, o in states:
+        stable = p | o
+        for square in range(8):
+            if stable == 0:
+                break
+            if (p | o) >> square & 1:
+                continue
+            # Coup du joueur puis coup de l'adversaire sur cette case : seuls
+            # les pions stables dans l'état atteint et qui n'ont pas changé de
+            # couleur restent stables
+            flips = EdgeFlips(p, o, square)
+            p2, o2 = p | flips | (1 << square), o & ~flips
+            stable &= table[Ternary[p2] + 2*Ternary[o2]] & ~flips
+            flips = EdgeFlips(o, p, square)
+            p2, o2 = p & ~flips, o | flips | (1 << square)
+            stable &= table[Ternary[p2] + 2*Ternary[o2]] & ~flips
+        table[Ternary[p] + 2*Ternary[o]] = stable
+    EdgeTable = table
+
+# ============================================================================ #
+
+def EdgeBits(disks, edge):
+# Fonction qui renvoie les cases (8 bits) d'un bord occupées par des pions
+# PARAMÈTRES:
+#     disks : pions du plateau
+#     edge : liste des cases du bord (voir EDGES)
+
+    bits = 0
+    for i in range(8):
+        if disks >> edge[i] & 1:
+            bits |= 1 << i
+    return bits
+
+# ============================================================================ #
+
+def Shift(disks, shift, mask):
+# Fonction qui déplace des pions d'une case dans une direction (voir AXES)
+# PARAMÈTRES:
+#     disks : pions à déplacer
+#     shift : décalage de la direction
+#     mask : masque de la direction
+
+    if shift > 0:
+        return (disks << shift) & mask & FULL
+    return (disks >> -shift) & mask
+
+# ============================================================================ #
+
+def GetStableDisks(player, opponent):
+# Fonction qui renvoie les pions stables du joueur (un bit par case). Un pion
+# est stable si, dans chacun des 4 axes, la ligne qui le traverse est pleine
+# ou l'un de ses deux voisins est un bord du plateau ou un pion stable du
+# joueur. On part des pions stables des bords (EdgeTable) et de ceux dont
+# toutes les lignes sont pleines, puis on propage jusqu'à ce que plus aucun
+# pion ne s'ajoute.
+# PARAMÈTRES:
+#     player : pions du joueur
+#     opponent : pions de l'adversaire
+
+    occupied = player | opponent
+    # Sans coin occupé, aucune ligne n'est pleine et aucun pion du bord n'est
+    # stable : rien ne peut l'être
+    if occupied & CORNERS == 0:
+        return 0
+    if EdgeTable == None:
+        BuildEdgeTable()
+
+    # Pions stables des bords
+    stable = 0
+    for edge in EDGES:
+        bits = EdgeTable[Ternary[EdgeBits(player, edge)]
+                         + 2*Ternary[EdgeBits(opponent, edge)]]
+        for i in range(8):
+            if bits >> i & 1:
+                stable |= 1 << edge[i]
+    stable &= player
+
+    # Cases dont la ligne est pleine ou qui touchent le bord, dans chaque axe :
+    # de ce côté, aucun pion adverse ne pourra jamais les encadrer
+    safe = []
+    for axis in range(4):
+        full = WALLS[axis]
+        for line in Lines[axis]:
+            if occupied & line == line:
+                full |= line
+        safe.append(full)
+    stable |= player & safe[0] & safe[1] & safe[2] & safe[3]
+
+    # Propagation : un pion est stable si dans chaque axe sa ligne est pleine
+    # ou un de ses voisins est stable
+    while True:
+        candidates = player & ~stable
+        for axis in range(4):
+            (shift1, mask1), (shift2, mask2) = AXES[axis]
+            candidates &= safe[axis] | Shift(stable, shift1, mask1) \
+                                     | Shift(stable, shift2, mask2)
+        if candidates == 0:
+            return stable
+        stable |= candidates
+
+# ============================================================================ #
+
+def CountStableDisks(player, opponent):
+# Fonction qui renvoie le nombre de pions stables du joueur
+# PARAMÈTRES:
+#     player : pions du joueur
+#     opponent : pions de l'adversaire
+
+    return bin(GetStableDisks(player, opponent)).count("1")
@@ -0,0 +1,116 @@
+################################################################################
+#                                                                              #
+# startup.py : Module qui mesure la durée de chaque étape du démarrage du jeu  #
+#     (import de sdl2, chargement des librairies, initialisation, première     #
+#     image) et en produit un rapport texte et JSON                            #
+#                                                                              #
+# Ce module n'importe pas sdl2 pour pouvoir mesurer son import                 #
+#                                                                              #
+################################################################################
+
+import json, sys, time
+
+# ============================================================================ #
+# GLOBALES                                                                     #
+# ============================================================================ #
+
+# Instant de référence du démarrage (import de ce module, à faire en premier)
+Origin = time.perf_counter()
+
+# Étapes mesurées, dans l'ordre où elles se sont terminées
+# Format: [[str : nom de l'étape, float : durée en secondes], ...]
+Phases = []
+
+# Durée entre Origin et l'affichage de la première image (None avant celle-ci)
+FirstFrame = None
+
+# ============================================================================ #
+# FONCTIONS                                                                    #
+# ============================================================================ #
+
+def Start():
+# Fonction qui renvoie l'instant actuel, à passer à Record() à la fin de l'étape
+# AUCUN PARAMÈTRE
+
+    return time.perf_counter()
+
+# ============================================================================ #
+
+def Record(name, start):
+# Fonction qui enregistre la durée d'une étape du démarrage
+# PARAMÈTRES:
+#     name : nom de l'étape
+#     start : instant du début de l'étape (renvoyé par Start())
+
+    Phases.append([name, time.perf_counter() - start])
+
+# ============================================================================ #
+
+def RecordFirstFrame():
+# Fonction qui enregistre le temps écoulé jusqu'à la première image affichée.
+# Seul le premier appel est pris en compte.
+# AUCUN PARAMÈTRE
+
+    global FirstFrame
+
+    if FirstFrame == None:
+        FirstFrame = time.perf_counter() - Origin
+
+# ============================================================================ #
+
+def Libraries():
+# Fonction qui renvoie les librairies de la SDL chargées avec, pour chacune, la
+# durée de sa recherche et de son chargement et celle de la liaison de ses
+# fonctions regroupées par sous-module de sdl2
+# Format: {str : librairie : {"load" : float, "bindings" : {str : float}}}
+# AUCUN PARAMÈTRE
+
+    libraries = {}
+    for name in ("sdl2.dll", "sdl2.sdlimage", "sdl2.sdlttf"):
+        module = sys.modules.get(name)
+        if module == None:
+            continue
+        bindings = {}
+        for moduleName, funcName, seconds in module.dll.bind_times:
+            bindings[moduleName] = bindings.get(moduleName, 0.0) + seconds
+        libraries[module.dll.libfile] = {"load": module.dll.load_time,
+                                         "bindings": bindings}
+    return libraries
+
+# ============================================================================ #
+
+def Report():
+# Fonction qui renvoie le rapport texte du démarrage, les étapes étant triées
+# de la plus longue à la plus courte
+# AUCUN PARAMÈTRE
+
+    lines = ["Démarrage (en ms) :"]
+    for name, seconds in sorted(Phases, key=lambda phase: -phase[1]):
+        lines.append("{:>10.2f}  {}".format(1000 * seconds, name))
+
+    for libfile, library in Libraries().items():
+        lines.append("Librairie {} : chargement {:.2f} ms".format(
+                         libfile, 1000 * library["load"]))
+        for moduleName, seconds in sorted(library["bindings"].items(),
+                                          key=lambda binding: -binding[1]):
+            lines.append("{:>10.2f}  liaison {}".format(1000 * seconds,
+                                                        moduleName))
+
+    if FirstFrame != None:
+        lines.append("Première image affichée après {:.2f} ms".format(
+                         1000 * FirstFrame))
+    return "\n".join(lines)
+
+# ============================================================================ #
+
+def WriteJSON(path):
+# Fonction qui enregistre les mesures du démarrage au format JSON (durées en
+# secondes) pour suivre leur évolution d'une version à l'autre
+# PARAMÈTRES:
+#     path : chemin du fichier à écrire
+
+    with open(path, "w") as file:
+        json.dump({"phases": [{"name": name, "seconds": seconds}
+                              for name, seconds in Phases],
+                   "libraries": Libraries(),
+                   "first_frame": FirstFrame}, file, indent=2)
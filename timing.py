@@ -0,0 +1,145 @@
+################################################################################
+#                                                                              #
+# timing.py : Module qui mesure la durée de chaque étape de l'affichage d'une  #
+#     image (plateau, interface, présentation à l'écran) avec le compteur haute#
+#     précision de la SDL et en calcule des statistiques                       #
+#                                                                              #
+################################################################################
+
+from sdl2 import SDL_GetPerformanceCounter, SDL_GetPerformanceFrequency
+
+# ============================================================================ #
+# CONSTANTES                                                                   #
+# ============================================================================ #
+
+# Étapes mesurées pour chaque image
+PHASE_BOARD   = 0  # Affichage du plateau (display.DrawBoard)
+PHASE_UI      = 1  # Affichage de l'interface (display.DrawUI)
+PHASE_PRESENT = 2  # Présentation à l'écran (display.UpdateWindow)
+PHASE_FRAME   = 3  # Durée totale de l'image
+
+# Noms des étapes utilisés dans les rapports
+PHASE_NAMES = ["Plateau", "Interface", "Présentation", "Image"]
+
+# Nombre d'images conservées dans l'historique (4 secondes à 60Hz)
+FRAME_HISTORY = 240
+
+# Durée maximale d'une image pour tenir 60Hz (en secondes)
+FRAME_BUDGET = 1/60
+
+# Nombre d'images entre deux mises à jour du texte de l'incrustation
+OVERLAY_REFRESH = 30
+
+# ============================================================================ #
+# GLOBALES                                                                     #
+# ============================================================================ #
+
+# Fréquence du compteur haute précision (nombre de graduations par seconde)
+Frequency = SDL_GetPerformanceFrequency()
+
+# Historique circulaire des durées (en secondes) de chaque étape
+# Format: [list : durées de l'étape PHASE_BOARD, ..., de l'étape PHASE_FRAME]
+Samples = [[0.0] * FRAME_HISTORY for name in PHASE_NAMES]
+
+# Nombre total d'images mesurées (l'indice de la prochaine mesure dans
+# l'historique est FrameCount % FRAME_HISTORY)
+FrameCount = 0
+
+# Booléen indiquant si les statistiques doivent être incrustées à l'écran
+Overlay = False
+
+# Texte de l'incrustation, mis à jour toutes les OVERLAY_REFRESH images
+OverlayText = ""
+
+# ============================================================================ #
+# FONCTIONS                                                                    #
+# ============================================================================ #
+
+def Counter():
+# Fonction qui renvoie la valeur actuelle du compteur haute précision
+# AUCUN PARAMÈTRE
+
+    return SDL_GetPerformanceCounter()
+
+# ============================================================================ #
+
+def Seconds(ticks):
+# Fonction qui convertit une durée du compteur haute précision en secondes
+# PARAMÈTRES:
+#     ticks : durée en graduations du compteur
+
+    return ticks / Frequency
+
+# ============================================================================ #
+
+def RecordFrame(start, boardEnd, uiEnd, presentEnd):
+# Fonction qui enregistre les durées des étapes d'une image dans l'historique à
+# partir des valeurs du compteur relevées entre chaque étape
+# PARAMÈTRES:
+#     start : valeur du compteur au début de l'image
+#     boardEnd : valeur du compteur après l'affichage du plateau
+#     uiEnd : valeur du compteur après l'affichage de l'interface
+#     presentEnd : valeur du compteur après la présentation à l'écran
+
+    global FrameCount, OverlayText
+
+    index = FrameCount % FRAME_HISTORY
+    Samples[PHASE_BOARD][index] = Seconds(boardEnd - start)
+    Samples[PHASE_UI][index] = Seconds(uiEnd - boardEnd)
+    Samples[PHASE_PRESENT][index] = Seconds(presentEnd - uiEnd)
+    Samples[PHASE_FRAME][index] = Seconds(presentEnd - start)
+    FrameCount += 1
+
+    # On ne régénère le texte de l'incrustation que de temps en temps pour
+    # qu'il reste lisible et ne coûte pas un rendu de texte à chaque image
+    if Overlay and FrameCount % OVERLAY_REFRESH == 1:
+        OverlayText = "{} : {:.2f} / {:.2f} / {:.2f} ms".format(
+                          PHASE_NAMES[PHASE_FRAME],
+                          *[1000 * Percentile(PHASE_FRAME, p)
+                            for p in (50, 95, 99)])
+
+# ============================================================================ #
+
+def Percentile(phase, percent):
+# Fonction qui renvoie le centile d'une étape (en secondes) sur les images de
+# l'historique, ou 0 si aucune image n'a été mesurée
+# PARAMÈTRES:
+#     phase : étape concernée (PHASE_BOARD, PHASE_UI, ...)
+#     percent : centile voulu (ex: 95 pour le 95e centile)
+
+    count = min(FrameCount, FRAME_HISTORY)
+    if count == 0:
+        return 0.0
+    samples = sorted(Samples[phase][:count])
+    # Méthode du rang le plus proche
+    rank = max(1, -(-percent * count // 100))
+    return samples[rank - 1]
+
+# ============================================================================ #
+
+def OverBudget():
+# Fonction qui renvoie le nombre d'images de l'historique qui ont dépassé la
+# durée FRAME_BUDGET
+# AUCUN PARAMÈTRE
+
+    count = min(FrameCount, FRAME_HISTORY)
+    return len([s for s in Samples[PHASE_FRAME][:count] if s > FRAME_BUDGET])
+
+# ============================================================================ #
+
+def Report():
+# Fonction qui renvoie un rapport texte des centiles p50/p95/p99 de chaque
+# étape sur les images de l'historique
+# AUCUN PARAMÈTRE
+
+    count = min(FrameCount, FRAME_HISTORY)
+    lines = ["Durée des images ({} dernières sur {}, en ms) :"
+             .format(count, FrameCount),
+             "{:<14}{:>8}{:>8}{:>8}".format("", "p50", "p95", "p99")]
+    for phase in range(len(PHASE_NAMES)):
+        lines.append("{:<14}{:>8.2f}{:>8.2f}{:>8.2f}".format(
+                         PHASE_NAMES[phase],
+                         *[1000 * Percentile(phase, p) for p in (50, 95, 99)]))
+    lines.append("Images au-delà du budget de {:.2f} ms : {}"
+                 .format(1000 * FRAME_BUDGET, OverBudget()))
+    return "\n".join(lines)
@@ -9,7 +9,7 @@
 import time
 from sdl2 import *
 
-import display
+import display, engine, startup, timing
 
 # ============================================================================ #
 # CONSTANTES                                                                   #
@@ -20,90 +20,250 @@ import display
 # le programme
 SIG_CLOSE_WINDOW = -1
 
+# Valeur renvoyée par WaitClick() quand le processus de recherche de
+# l'ordinateur a trouvé son coup (voir engine.Result)
+SIG_ENGINE_MOVE = -2
+
+# Nombre maximal d'évènements récupérés en un seul appel à SDL_PeepEvents()
+EVENT_BUFFER_SIZE = 64
+
+# Types d'évènements dont le jeu ne se sert jamais (clavier, molette, manettes,
+# écrans tactiles, gestes, presse-papier, glisser-déposer...). Ils sont
+# désactivés par Init() : la SDL les ignore sans les placer dans la file.
+INPUT_IGNORED = [SDL_SYSWMEVENT, SDL_KEYDOWN, SDL_KEYUP, SDL_TEXTEDITING,
+                 SDL_TEXTINPUT, SDL_MOUSEWHEEL, SDL_JOYAXISMOTION,
+                 SDL_JOYBALLMOTION, SDL_JOYHATMOTION, SDL_JOYBUTTONDOWN,
+                 SDL_JOYBUTTONUP, SDL_JOYDEVICEADDED, SDL_JOYDEVICEREMOVED,
+                 SDL_CONTROLLERAXISMOTION, SDL_CONTROLLERBUTTONDOWN,
+                 SDL_CONTROLLERBUTTONUP, SDL_CONTROLLERDEVICEADDED,
+                 SDL_CONTROLLERDEVICEREMOVED, SDL_CONTROLLERDEVICEREMAPPED,
+                 SDL_FINGERDOWN, SDL_FINGERUP, SDL_FINGERMOTION,
+                 SDL_DOLLARGESTURE, SDL_DOLLARRECORD, SDL_MULTIGESTURE,
+                 SDL_CLIPBOARDUPDATE, SDL_DROPFILE]
+
+# Profils d'entrée : types d'évènements utilisés par chaque interface. Les types
+# présents dans un profil mais absents de celui de l'interface affichée sont
+# désactivés par SetInputProfile()
+# Format: {int : interface (display.UI_MODE_*) : [int : type d'évènement]}
+INPUT_PROFILES = {display.UI_MODE_INGAME: [SDL_WINDOWEVENT, SDL_MOUSEMOTION,
+                                           SDL_MOUSEBUTTONDOWN,
+                                           SDL_MOUSEBUTTONUP],
+                  display.UI_MODE_SCORES: [SDL_WINDOWEVENT, SDL_MOUSEMOTION,
+                                           SDL_MOUSEBUTTONDOWN,
+                                           SDL_MOUSEBUTTONUP]}
+
+# ============================================================================ #
+# GLOBALES                                                                     #
+# ============================================================================ #
+
+# Tableau ctypes d'évènements alloué une seule fois, dans lequel WaitClick()
+# récupère les évènements en attente
+Events = (SDL_Event * EVENT_BUFFER_SIZE)()
+
+# Nombre d'évènements récupérés dans Events et position du prochain à traiter.
+# WaitClick() peut s'arrêter au milieu d'un paquet (clic, fermeture) : les
+# évènements suivants y restent et sont traités en premier à l'appel suivant
+EventsCount = 0
+EventsNext = 0
+
+# Interface dont le profil d'entrée est actif (None si aucun)
+InputProfile = None
+
+# Booléen indiquant si l'évaluation de chaque coup possible (voir
+# engine.Analysis) est affichée sur les indices
+ShowAnalysis = False
+
 # ============================================================================ #
 # FONCTIONS                                                                    #
 # ============================================================================ #
 
-def Init():
+def Init(renderer=display.RENDERER_SOFTWARE):
 # Fonction qui initialise l'interface graphique en initialisant le sous-système
 # évènement et également le module display
-# AUCUN PARAMÈTRE
+# PARAMÈTRES:
+#     renderer : moteur de rendu transmis à display.Init()
 
+    start = startup.Start()
     if SDL_InitSubSystem(SDL_INIT_EVENTS) != 0:
         raise Exception("Erreur d'initialisation de SDL2 (Évènements) : " +
                         SDL_GetError().decode())
-    display.Init()
+    startup.Record("ui.Init : SDL (évènements)", start)
+    start = startup.Start()
+    display.Init(renderer)
+    startup.Record("ui.Init : display.Init (total)", start)
+
+    # On désactive les évènements dont le jeu ne se sert pas. Ce doit être fait
+    # après display.Init() : l'initialisation de la vidéo appelle
+    # SDL_StartTextInput(), qui réactive SDL_TEXTINPUT et SDL_TEXTEDITING
+    for eventType in INPUT_IGNORED:
+        SDL_EventState(eventType, SDL_IGNORE)
 
 # ============================================================================ #
 
-def WaitClick(board, ui, data):
+def SetInputProfile(ui):
+# Fonction qui active le profil d'entrée d'une interface (voir INPUT_PROFILES) :
+# seuls les types d'évènements qu'elle utilise sont placés dans la file
+# PARAMÈTRES:
+#     ui : interface dont on veut activer le profil
+
+    global InputProfile
+
+    if InputProfile == ui:
+        return
+    profile = INPUT_PROFILES[ui]
+    for eventTypes in INPUT_PROFILES.values():
+        for eventType in eventTypes:
+            SDL_EventState(eventType,
+                           SDL_ENABLE if eventType in profile else SDL_IGNORE)
+    InputProfile = ui
+
+# ============================================================================ #
+
+def WaitClick(board, ui, data, thinking=False):
 # Fonction qui attend un clic dans la fenêtre et renvoit ses coordonnées (ou
-# SIG_CLOSE_WINDOW si la fenêtre a été fermée)
+# SIG_CLOSE_WINDOW si la fenêtre a été fermée, ou SIG_ENGINE_MOVE si
+# l'ordinateur a trouvé son coup)
 # PARAMÈTRES:
 #     board : tableau 2D des cases du plateau à afficher derrière l'interface
 #     ui : valeur indiquant quelle interface doit être affichée
 #     data : données supplémentaires à transmettre à display.DrawUI()
+#     thinking : booléen indiquant que l'ordinateur cherche son coup, les
+#         réponses de son processus de recherche sont alors lues entre deux
+#         images
+
+    global EventsCount, EventsNext
 
-    # Initialisation des différentes variables
-    event = SDL_Event()
+    # Seuls les évènements utilisés par cette interface arrivent dans la file
+    SetInputProfile(ui)
 
     # Variables de contrôle de la fréquence de raffraîchissement
     lastDraw = 0
     needDraw = True
 
+    # État de l'interface lors du dernier affichage : seuls l'élément survolé
+    # (voir display.HoveredElement()), le fait qu'il soit pressé et l'évaluation
+    # des coups changent l'image affichée, le plateau étant le même pendant
+    # tout l'appel. Un déplacement de la souris qui ne change pas cet état ne
+    # redessine rien.
+    # Format: (élément survolé, booléen : élément pressé,
+    #          int : version de l'évaluation (engine.AnalysisVersion), None
+    #          si elle n'est pas affichée)
+    drawnState = None
+
     # Coordonnées du curseur dans la fenêtre et statut du bouton gauche
     mouse_x = -1
     mouse_y = -1
     mouse_dw = False
 
     while True:
-        # Demande à la SDL si un évènement s'est produit et le cas échéant le
-        # traite en fonction des informations qu'il contient pour suivre les
-        # déplacements et les clics de la souris
-        while SDL_PollEvent(event) != 0:
+        # Récupère d'un coup (par paquets de EVENT_BUFFER_SIZE) les évènements
+        # en attente et les traite en fonction des informations qu'ils
+        # contiennent pour suivre les déplacements et les clics de la souris.
+        # Ceux laissés dans Events par l'appel précédent passent en premier.
+        SDL_PumpEvents()
+        more = True
+        while True:
+            if EventsNext >= EventsCount:
+                # Le dernier paquet n'était pas plein : la file est vide
+                if not more:
+                    break
+                EventsCount = max(SDL_PeepEvents(Events, EVENT_BUFFER_SIZE,
+                                                 SDL_GETEVENT, SDL_FIRSTEVENT,
+                                                 SDL_LASTEVENT), 0)
+                EventsNext = 0
+                more = EventsCount == EVENT_BUFFER_SIZE
+                if EventsCount == 0:
+                    break
+            # L'évènement est marqué comme traité avant d'être lu, pour qu'un
+            # retour en cours de paquet ne le traite pas une seconde fois
+            event = Events[EventsNext]
+            EventsNext += 1
             if event.type == SDL_WINDOWEVENT:
                 # L'utilisateur veut fermer la fenêtre, on renvoie
-                # SIG_CLOSE_WINDOW pour indiquer que le programme doit s'arrêter
+                # SIG_CLOSE_WINDOW pour indiquer que le programme doit
+                # s'arrêter
                 if event.window.event == SDL_WINDOWEVENT_CLOSE:
                     return SIG_CLOSE_WINDOW
-                # La souris quitte la fenêtre, on réinitialise les variables
+                # La souris quitte la fenêtre, on réinitialise les
+                # variables
                 elif event.window.event == SDL_WINDOWEVENT_LEAVE:
                     mouse_x = -1
                     mouse_y = -1
                     mouse_dw = False
+                # La fenêtre revient au 1er plan, a été redimensionnée ou
+                # doit être redessinée : on doit réafficher son contenu
+                elif event.window.event in (SDL_WINDOWEVENT_FOCUS_GAINED,
+                                            SDL_WINDOWEVENT_SIZE_CHANGED,
+                                            SDL_WINDOWEVENT_EXPOSED):
                     needDraw = True
-                # La fenêtre revient au 1er plan, on doit réafficher son contenu
-                elif event.window.event == SDL_WINDOWEVENT_FOCUS_GAINED:
-                    needDraw = True
-            # La souris a été déplacée dans la fenêtre
+            # La souris a été déplacée dans la fenêtre. Un déplacement
+            # immédiatement suivi d'un autre est ignoré : seule la dernière
+            # position compte (une souris à 1000Hz en envoie des dizaines
+            # par image)
             elif event.type == SDL_MOUSEMOTION:
+                if EventsNext < EventsCount \
+                and Events[EventsNext].type == SDL_MOUSEMOTION:
+                    continue
                 mouse_x = event.motion.x
                 mouse_y = event.motion.y
                 mouse_dw = bool(event.motion.state & SDL_BUTTON_LMASK)
-                needDraw = True
             # Le bouton gauche de la souris est pressé
             elif event.type == SDL_MOUSEBUTTONDOWN:
                 if event.button.button == SDL_BUTTON_LEFT:
                     mouse_x = event.button.x
                     mouse_y = event.button.y
                     mouse_dw = True
-                    needDraw = True
             # Le bouton gauche de la souris est relaché = clic
             elif event.type == SDL_MOUSEBUTTONUP:
                 if event.button.button == SDL_BUTTON_LEFT:
                     return (event.button.x, event.button.y)
 
+        # On lit les réponses du processus de recherche : si l'ordinateur a
+        # trouvé son coup, on le signale à l'appelant
+        if engine.Poll() and thinking:
+            return SIG_ENGINE_MOVE
+
+        # On ne redessine que si l'état de l'interface (ou l'évaluation des
+        # coups affichée) a changé. La réflexion anticipée met l'évaluation à
+        # jour même quand elle n'est pas affichée : sa version n'est alors pas
+        # prise en compte
+        hovered = display.HoveredElement(ui, mouse_x, mouse_y, data)
+        analysisVersion = None
+        if ui == display.UI_MODE_INGAME and data[2] != None:
+            analysisVersion = engine.AnalysisVersion
+        state = (hovered, hovered != None and mouse_dw, analysisVersion)
+        if state != drawnState:
+            needDraw = True
+
         # Affiche le plateau et l'interface graphique tout en faisant en sorte
         # d'alléger la charge processeur en ne raffraîchissant l'affichage que
         # lorsque c'est nécessaire et à la fréquence maximale de 60Hz (fréquence
         # de raffraîchissement des écrans la plus commune)
-        if needDraw and (time.time() - lastDraw) >= 1/60:
-            display.DrawBoard(board)
+        # La durée de chaque étape est mesurée par le module timing
+        start = timing.Counter()
+        if needDraw and timing.Seconds(start - lastDraw) >= 1/60:
+            # Hors du jeu, le plateau est affiché assombri depuis un
+            # arrière-plan déjà composé
+            if ui == display.UI_MODE_INGAME:
+                display.DrawBoard(board)
+            else:
+                display.DrawBackdrop(board)
+            boardEnd = timing.Counter()
             display.DrawUI(ui, mouse_x, mouse_y, mouse_dw, data)
+            if timing.Overlay:
+                display.DrawOverlay(timing.OverlayText)
+            uiEnd = timing.Counter()
             display.UpdateWindow()
+            lastDraw = timing.Counter()
+            timing.RecordFrame(start, boardEnd, uiEnd, lastDraw)
+            startup.RecordFirstFrame()
+            drawnState = state
             needDraw = False
-            lastDraw = time.time()
         else:
+            # On profite du temps libre après la première image pour préparer
+            # l'interface des scores (ne fait rien une fois qu'elle est prête)
+            if lastDraw != 0:
+                display.Prewarm()
             time.sleep(1/120)
     return
 
@@ -117,21 +277,51 @@ def WaitPlay(board, possibilities, playerColor):
 #     possibilities : liste des cases où le joueur peut placer un pion
 #     playerColor : couleur des pions du joueur
 
+    # Si l'ordinateur joue (ou si l'évaluation des coups est affichée), il
+    # réfléchit pendant que le joueur choisit son coup
+    engine.Ponder(board, playerColor)
+
+    # L'évaluation des coups est modifiée sur place par engine.Poll()
+    analysis = engine.Analysis if ShowAnalysis else None
     while True:
         click = WaitClick(board, display.UI_MODE_INGAME,
-                          [possibilities, playerColor])
+                          [possibilities, playerColor, analysis])
         # Si l'utilisateur ferme la fenêtre, on transmet le signal
         if click == SIG_CLOSE_WINDOW:
             return SIG_CLOSE_WINDOW
         else:
-            # On calcule les coordonnées de la case qui a été sélectionnée
-            tile_x = int((click[0]-32) / 66)
-            tile_y = int((click[1]-32) / 66)
+            # On récupère les coordonnées de la case qui a été sélectionnée
+            tile = display.HitTest(display.UI_MODE_INGAME, click[0], click[1])
             # On vérifie si le joueur peut jouer sur cette case, si c'est le
             # cas on renvoit ses coordonnées
-            for possibility in possibilities:
-                if possibility[0] == tile_x and possibility[1] == tile_y:
-                    return possibility
+            if tile in possibilities:
+                return tile
+    return
+
+# ============================================================================ #
+
+def WaitComputer(board, playerColor):
+# Fonction qui attend que l'ordinateur joue son tour et renvoie les coordonnées
+# du pion qu'il a posé. La fenêtre continue d'être affichée pendant qu'il
+# réfléchit, un clic lui demande de jouer tout de suite.
+# PARAMÈTRES:
+#     board : tableau 2D qui représente les cases du plateau
+#     playerColor : couleur des pions de l'ordinateur
+
+    engine.RequestMove(board, playerColor)
+    while True:
+        # Aucun indice n'est affiché pendant le tour de l'ordinateur
+        signal = WaitClick(board, display.UI_MODE_INGAME,
+                           [[], playerColor, None], True)
+        # Si l'utilisateur ferme la fenêtre, on abandonne la recherche et on
+        # transmet le signal
+        if signal == SIG_CLOSE_WINDOW:
+            engine.Cancel()
+            return SIG_CLOSE_WINDOW
+        elif signal == SIG_ENGINE_MOVE:
+            return engine.Result
+        else:
+            engine.MoveNow()
     return
 
 # ============================================================================ #
@@ -154,12 +344,14 @@ def DisplayScores(board, scores):
         if click == SIG_CLOSE_WINDOW:
             return SIG_CLOSE_WINDOW
         else:
+            button = display.HitTest(display.UI_MODE_SCORES,
+                                     click[0], click[1])
             # Si le joueur a cliqué sur "Nouvelle partie", on renvoit None
-            if display.MouseIn(click[0], click[1],  70, 295, 370, 408):
+            if button == display.BUTTON_NEWGAME:
                 return
             # Si le joueur a cliqué sur "Quitter le jeu", on renvoit le signal
             # SIG_CLOSE_WINDOW
-            if display.MouseIn(click[0], click[1], 328, 521, 370, 408):
+            if button == display.BUTTON_QUIT:
                 return SIG_CLOSE_WINDOW
     return
 